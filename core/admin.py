@@ -35,16 +35,27 @@ class BreedAdmin(admin.ModelAdmin):
     list_filter = ['animal_type']
     search_fields = ['name', 'animal_type__name']
     ordering = ['animal_type', 'name']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('animal_type')
 
 
 @admin.register(Livestock)
 class LivestockAdmin(admin.ModelAdmin):
-    list_display = ['tag_number', 'name', 'animal_type', 'breed', 'gender', 'status', 'farmer', 'age_months']
+    list_display = ['tag_number', 'name', 'animal_type', 'breed', 'gender', 'status', 'farmer', 'age_months', 'total_costs']
     list_filter = ['animal_type', 'breed', 'gender', 'status', 'purpose']
     search_fields = ['tag_number', 'name', 'farmer__username']
     ordering = ['animal_type', 'tag_number']
-    readonly_fields = ['age_months', 'created_at', 'updated_at']
-    
+    # total_costs is maintained by the CostRecord signals; keep manual
+    # edits from overwriting it
+    readonly_fields = ['age_months', 'total_costs', 'created_at', 'updated_at']
+    list_select_related = ['animal_type', 'breed', 'farmer']
+    # Keep the changelist cheap on large tables: bounded pages, no second
+    # unfiltered COUNT(*), and sorting only on indexed columns
+    sortable_by = ['tag_number', 'animal_type', 'created_at']
+    show_full_result_count = False
+    list_per_page = 25
+
     fieldsets = (
         ('Basic Information', {
             'fields': ('farmer', 'animal_type', 'breed', 'tag_number', 'name')
@@ -73,7 +84,7 @@ class FeedTypeAdmin(admin.ModelAdmin):
     list_display = ['name', 'category', 'protein_percentage', 'energy_mj_per_kg', 'cost_per_kg']
     list_filter = ['category']
     search_fields = ['name']
-    filter_horizontal = ['suitable_for']
+    autocomplete_fields = ['suitable_for']
     ordering = ['category', 'name']
 
 
@@ -83,6 +94,9 @@ class FeedingRecommendationAdmin(admin.ModelAdmin):
     list_filter = ['animal_type', 'feed_type', 'purpose']
     search_fields = ['animal_type__name', 'feed_type__name']
     ordering = ['animal_type', 'feed_type']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('animal_type', 'feed_type')
 
 
 @admin.register(Disease)
@@ -90,7 +104,7 @@ class DiseaseAdmin(admin.ModelAdmin):
     list_display = ['name', 'severity', 'is_contagious', 'vet_required']
     list_filter = ['severity', 'is_contagious', 'vet_required', 'affected_animals']
     search_fields = ['name']
-    filter_horizontal = ['affected_animals']
+    autocomplete_fields = ['affected_animals']
     ordering = ['name']
 
 
@@ -98,11 +112,16 @@ class DiseaseAdmin(admin.ModelAdmin):
 class SymptomAdmin(admin.ModelAdmin):
     list_display = ['name', 'get_related_diseases']
     search_fields = ['name']
-    filter_horizontal = ['diseases']
+    autocomplete_fields = ['diseases']
     ordering = ['name']
-    
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).prefetch_related('diseases')
+
     def get_related_diseases(self, obj):
-        return ", ".join([disease.name for disease in obj.diseases.all()[:3]])
+        # Slice the prefetched list in Python - slicing the queryset would
+        # bypass the prefetch cache and re-issue SQL per row
+        return ", ".join([disease.name for disease in list(obj.diseases.all())[:3]])
     get_related_diseases.short_description = 'Related Diseases (first 3)'
 
 
@@ -111,9 +130,12 @@ class HealthRecordAdmin(admin.ModelAdmin):
     list_display = ['livestock', 'date_recorded', 'suspected_disease', 'recovery_status', 'veterinarian_consulted']
     list_filter = ['recovery_status', 'veterinarian_consulted', 'suspected_disease']
     search_fields = ['livestock__tag_number', 'livestock__name']
-    filter_horizontal = ['symptoms']
+    autocomplete_fields = ['symptoms']
     ordering = ['-date_recorded']
     readonly_fields = ['date_recorded']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('livestock__animal_type', 'suspected_disease')
 
 
 @admin.register(MarketPrice)
@@ -123,6 +145,9 @@ class MarketPriceAdmin(admin.ModelAdmin):
     search_fields = ['animal_type__name', 'location']
     ordering = ['-date_recorded', 'animal_type']
     readonly_fields = ['created_at']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('animal_type', 'breed')
 
 
 # Customize admin site header and title
@@ -1,8 +1,15 @@
 from rest_framework import generics, status
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.pagination import CursorPagination
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
+from datetime import date, timedelta
+
+from django.core.cache import cache
+from django.db.models import Avg, Prefetch
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
@@ -18,12 +25,31 @@ from .serializers import (
     LivestockSimpleSerializer, SymptomAnalysisInputSerializer, DiseaseResultSerializer,
     SymptomAnalysisResponseSerializer, HealthRecordCreateSerializer, 
     PreventionRecommendationSerializer, SymptomSuggestionSerializer,
-    PriceAnalysisInputSerializer, PriceAnalysisResultSerializer, 
-    ProfitabilityResultSerializer, SellingRecommendationSerializer
+    PriceAnalysisInputSerializer, PriceAnalysisResultSerializer,
+    ProfitabilityResultSerializer, SellingRecommendationSerializer,
+    validate_feeding_input
+)
+from .cache_utils import (
+    feeding_recommendation_cache_key, get_cached_animal_type,
+    get_reference_cache_version, latest_market_prices_cache_key,
+    price_analysis_cache_key, reference_list_cache_key
 )
 from .services import FeedingRecommendationService, AnimalInput, DiseaseMonitoringService, SymptomInput
 from .pricing_service import PricingAnalysisService, PriceAnalysisInput
 
+# Reused per request instead of allocating a fresh timedelta each call
+_THIRTY_DAYS = timedelta(days=30)
+
+# TTL for public lookup endpoints whose responses vary only by querystring
+LOOKUP_CACHE_TTL = 60 * 15
+
+# Shared swagger schema for "array of objects" payload members; building it
+# once keeps the doc definitions for the list-shaped responses deduplicated
+OBJECT_ARRAY_SCHEMA = openapi.Schema(
+    type=openapi.TYPE_ARRAY,
+    items=openapi.Schema(type=openapi.TYPE_OBJECT)
+)
+
 
 # Feeding Module API Views
 
@@ -37,10 +63,7 @@ from .pricing_service import PricingAnalysisService, PriceAnalysisInput
             schema=openapi.Schema(
                 type=openapi.TYPE_OBJECT,
                 properties={
-                    'recommendations': openapi.Schema(
-                        type=openapi.TYPE_ARRAY,
-                        items=openapi.Schema(type=openapi.TYPE_OBJECT)
-                    ),
+                    'recommendations': OBJECT_ARRAY_SCHEMA,
                     'animal_info': openapi.Schema(type=openapi.TYPE_OBJECT),
                     'input_parameters': openapi.Schema(type=openapi.TYPE_OBJECT)
                 }
@@ -55,30 +78,56 @@ def get_feeding_recommendations(request):
     """
     Get feeding recommendations for an animal based on type, age, weight, and purpose
     """
-    serializer = FeedingRecommendationInputSerializer(data=request.data)
-    
-    if not serializer.is_valid():
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-    
+    # Fast plain-function validation - the schema is resolved at import time
+    # instead of rebuilding the DRF field tree on every request
+    validated_data, animal_type, errors = validate_feeding_input(request.data)
+
+    if errors:
+        return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
     # Create animal input object
     animal_input = AnimalInput(
-        animal_type_id=serializer.validated_data['animal_type_id'],
-        age_months=serializer.validated_data.get('age_months'),
-        weight_kg=serializer.validated_data.get('weight_kg'),
-        purpose=serializer.validated_data.get('purpose'),
-        livestock_id=serializer.validated_data.get('livestock_id')
+        animal_type_id=validated_data['animal_type_id'],
+        age_months=validated_data.get('age_months'),
+        weight_kg=validated_data.get('weight_kg'),
+        purpose=validated_data.get('purpose'),
+        livestock_id=validated_data.get('livestock_id')
     )
-    
-    # Get recommendations using the service
+
+    # Get recommendations using the service (cached - the output is a
+    # deterministic function of the validated input)
     service = FeedingRecommendationService()
-    recommendations = service.get_recommendations(animal_input)
-    
-    # Get animal type info
-    animal_type = get_object_or_404(AnimalType, id=animal_input.animal_type_id)
-    
-    # Serialize results
-    recommendation_data = FeedingResultSerializer(recommendations, many=True).data
-    
+    cache_key = feeding_recommendation_cache_key(validated_data)
+    recommendations = cache.get_or_set(
+        cache_key,
+        lambda: service.get_recommendations(animal_input),
+        60 * 60
+    )
+
+    # Short-circuit the common "no match" path before any serialization
+    if not recommendations:
+        return Response({
+            'recommendations': [],
+            'animal_info': {
+                'animal_type': animal_type.name,
+                'age_months': animal_input.age_months,
+                'weight_kg': animal_input.weight_kg,
+                'purpose': animal_input.purpose
+            },
+            'input_parameters': validated_data,
+            'total_recommendations': 0,
+            'total_daily_cost': 0,
+            'average_cost_per_kg': 0
+        }, status=status.HTTP_200_OK)
+
+    # Serialize and aggregate in one traversal of the recommendation list
+    recommendation_data = []
+    total_daily_cost = 0.0
+    for rec in recommendations:
+        recommendation_data.append(FeedingResultSerializer(rec).data)
+        total_daily_cost += rec.cost_per_day
+    recommendation_count = len(recommendations)
+
     response_data = {
         'recommendations': recommendation_data,
         'animal_info': {
@@ -87,10 +136,10 @@ def get_feeding_recommendations(request):
             'weight_kg': animal_input.weight_kg,
             'purpose': animal_input.purpose
         },
-        'input_parameters': serializer.validated_data,
-        'total_recommendations': len(recommendations),
-        'total_daily_cost': sum(rec.cost_per_day for rec in recommendations),
-        'average_cost_per_kg': sum(rec.cost_per_day for rec in recommendations) / len(recommendations) if recommendations else 0
+        'input_parameters': validated_data,
+        'total_recommendations': recommendation_count,
+        'total_daily_cost': total_daily_cost,
+        'average_cost_per_kg': total_daily_cost / recommendation_count if recommendation_count else 0
     }
     
     return Response(response_data, status=status.HTTP_200_OK)
@@ -110,16 +159,18 @@ def get_livestock_feeding_summary(request, livestock_id):
     """
     Get comprehensive feeding summary for a specific livestock animal
     """
-    # Verify livestock exists and belongs to user
-    livestock = get_object_or_404(Livestock, id=livestock_id, farmer=request.user)
-    
+    # Verify livestock exists and belongs to user; eager-load the relations
+    # the summary serializer walks so the service never refetches the row
+    livestock = get_object_or_404(
+        Livestock.objects.select_related('animal_type', 'breed', 'farmer'),
+        id=livestock_id,
+        farmer=request.user
+    )
+
     # Get feeding summary using service
     service = FeedingRecommendationService()
-    summary_data = service.get_feeding_summary_for_livestock(livestock_id)
-    
-    if 'error' in summary_data:
-        return Response({'error': summary_data['error']}, status=status.HTTP_404_NOT_FOUND)
-    
+    summary_data = service.get_feeding_summary_for_livestock(livestock)
+
     # Serialize the response
     serializer = FeedingSummarySerializer(summary_data)
     
@@ -128,61 +179,130 @@ def get_livestock_feeding_summary(request, livestock_id):
 
 # Lookup/Reference API Views
 
-class AnimalTypeListView(generics.ListAPIView):
+class ReferenceETagMixin:
+    """
+    Weak ETag for reference-data list endpoints, derived from the cache
+    version that the reference signals bump on every change. A matching
+    If-None-Match short-circuits to an empty 304 before any queries run.
+    """
+
+    def list(self, request, *args, **kwargs):
+        etag = f'W/"reference-v{get_reference_cache_version()}"'
+        if request.headers.get('If-None-Match') == etag:
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        response = super().list(request, *args, **kwargs)
+        response['ETag'] = etag
+        return response
+
+
+class CachedListMixin:
+    """
+    Serves a list endpoint's serialized payload from cache. Intended for
+    public reference data that changes rarely; keys are version-prefixed
+    and invalidated by the matching model signals.
+    """
+    cache_name = None
+
+    def list(self, request, *args, **kwargs):
+        cache_key = reference_list_cache_key(self.cache_name)
+        data = cache.get(cache_key)
+        if data is None:
+            data = self.get_serializer(self.get_queryset(), many=True).data
+            cache.set(cache_key, data, 60 * 60)
+        return Response(data)
+
+
+class AnimalTypeListView(ReferenceETagMixin, CachedListMixin, generics.ListAPIView):
     """List all animal types (for dropdowns/selects)"""
-    queryset = AnimalType.objects.all()
+    queryset = AnimalType.objects.only('id', 'name')
     serializer_class = AnimalTypeSimpleSerializer
     permission_classes = [AllowAny]
+    cache_name = 'animal_types'
 
 
-class BreedListView(generics.ListAPIView):
+@method_decorator(cache_page(LOOKUP_CACHE_TTL), name='list')
+class BreedListView(ReferenceETagMixin, generics.ListAPIView):
     """List breeds, optionally filtered by animal type"""
     serializer_class = BreedSimpleSerializer
     permission_classes = [AllowAny]
-    
+
     def get_queryset(self):
-        queryset = Breed.objects.all().select_related('animal_type')
+        # Serializer only exposes the animal_type id, so the FK column on the
+        # breed row is enough - no JOIN needed, just a narrow projection
+        queryset = Breed.objects.only('id', 'name', 'animal_type')
         animal_type_id = self.request.query_params.get('animal_type', None)
-        
+
         if animal_type_id is not None:
             queryset = queryset.filter(animal_type_id=animal_type_id)
-        
+
         return queryset
 
 
-class FeedTypeListView(generics.ListAPIView):
+@method_decorator(cache_page(LOOKUP_CACHE_TTL), name='list')
+class FeedTypeListView(ReferenceETagMixin, generics.ListAPIView):
     """List feed types, optionally filtered by animal type"""
     serializer_class = FeedTypeSimpleSerializer
     permission_classes = [AllowAny]
-    
+
     def get_queryset(self):
-        queryset = FeedType.objects.all()
+        queryset = FeedType.objects.only('id', 'name', 'category', 'cost_per_kg')
         animal_type_id = self.request.query_params.get('animal_type', None)
-        
+
         if animal_type_id is not None:
             queryset = queryset.filter(suitable_for__id=animal_type_id)
-        
+
         return queryset
 
 
+class LivestockCursorPagination(CursorPagination):
+    """
+    Keyset pagination over (farmer, -created_at) so each page is a bounded
+    index range scan, regardless of herd size
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+    ordering = '-created_at'
+
+
 class UserLivestockListView(generics.ListAPIView):
     """List livestock for the authenticated user"""
     serializer_class = LivestockSimpleSerializer
     permission_classes = [IsAuthenticated]
-    
+    pagination_class = LivestockCursorPagination
+
     def get_queryset(self):
-        return Livestock.objects.filter(farmer=self.request.user).select_related('animal_type')
+        queryset = LivestockSimpleSerializer.optimize_queryset(
+            Livestock.objects.filter(farmer=self.request.user)
+        )
+        return queryset.only(
+            'id', 'tag_number', 'name', 'current_weight_kg', 'created_at', 'animal_type__name'
+        )
 
 
 # Disease Module API Views (for future sprint)
 
-class DiseaseListView(generics.ListAPIView):
+@method_decorator(cache_page(LOOKUP_CACHE_TTL), name='list')
+class DiseaseListView(ReferenceETagMixin, generics.ListAPIView):
     """List diseases, optionally filtered by animal type"""
     serializer_class = DiseaseSerializer
     permission_classes = [AllowAny]
     
     def get_queryset(self):
-        queryset = Disease.objects.all().prefetch_related('affected_animals', 'symptoms')
+        # Bound the prefetch queries to the columns the nested serializers
+        # actually emit, so per-disease work stays flat as the tables grow
+        queryset = Disease.objects.all().prefetch_related(
+            Prefetch(
+                'affected_animals',
+                queryset=AnimalType.objects.only('id', 'name', 'description'),
+                to_attr='prefetched_affected_animals'
+            ),
+            Prefetch(
+                'symptoms',
+                queryset=Symptom.objects.only('id', 'name', 'description'),
+                to_attr='prefetched_symptoms'
+            )
+        )
         animal_type_id = self.request.query_params.get('animal_type', None)
         
         if animal_type_id is not None:
@@ -191,33 +311,112 @@ class DiseaseListView(generics.ListAPIView):
         return queryset
 
 
-class SymptomListView(generics.ListAPIView):
+class SymptomListView(ReferenceETagMixin, CachedListMixin, generics.ListAPIView):
     """List all symptoms"""
     queryset = Symptom.objects.all()
     serializer_class = SymptomSerializer
     permission_classes = [AllowAny]
+    cache_name = 'symptoms'
 
 
 # Pricing Module API Views (for future sprint)
 
+# Columns needed to rebuild the MarketPriceSerializer payload from values() rows
+MARKET_PRICE_VALUES_FIELDS = (
+    'id', 'location', 'date_recorded', 'price_per_kg', 'min_weight_kg',
+    'max_weight_kg', 'quality_grade', 'source', 'notes',
+    'animal_type__id', 'animal_type__name', 'animal_type__description',
+    'breed__id', 'breed__name', 'breed__description',
+    'breed__average_weight_kg', 'breed__maturity_months',
+    'breed__animal_type__id', 'breed__animal_type__name',
+    'breed__animal_type__description',
+)
+
+
+def _format_decimal(value, places=2):
+    """Render a Decimal the way DRF's DecimalField would (fixed places)"""
+    if value is None:
+        return None
+    return f"{value:.{places}f}"
+
+
+def _build_market_price_dict(row):
+    """
+    Build the MarketPriceSerializer representation from a values() row,
+    bypassing model instantiation and per-field serializer dispatch.
+    """
+    breed = None
+    if row['breed__id'] is not None:
+        breed = {
+            'id': row['breed__id'],
+            'name': row['breed__name'],
+            'animal_type': {
+                'id': row['breed__animal_type__id'],
+                'name': row['breed__animal_type__name'],
+                'description': row['breed__animal_type__description'],
+            },
+            'animal_type_name': row['breed__animal_type__name'],
+            'description': row['breed__description'],
+            'average_weight_kg': _format_decimal(row['breed__average_weight_kg']),
+            'maturity_months': row['breed__maturity_months'],
+        }
+
+    return {
+        'id': row['id'],
+        'animal_type': {
+            'id': row['animal_type__id'],
+            'name': row['animal_type__name'],
+            'description': row['animal_type__description'],
+        },
+        'breed': breed,
+        'location': row['location'],
+        'date_recorded': row['date_recorded'].isoformat(),
+        'price_per_kg': _format_decimal(row['price_per_kg']),
+        'min_weight_kg': _format_decimal(row['min_weight_kg']),
+        'max_weight_kg': _format_decimal(row['max_weight_kg']),
+        'quality_grade': row['quality_grade'],
+        'source': row['source'],
+        'notes': row['notes'],
+    }
+
+
+class MarketPriceCursorPagination(CursorPagination):
+    # Cursor over (date_recorded, id) stays O(page_size) at any depth,
+    # unlike OFFSET which scans and discards every earlier row; the id
+    # tie-breaker keeps pages stable when several prices share a date
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+    ordering = ('-date_recorded', '-id')
+
+
 class MarketPriceListView(generics.ListAPIView):
     """List market prices, optionally filtered by animal type and location"""
     serializer_class = MarketPriceSerializer
     permission_classes = [AllowAny]
-    
+    pagination_class = MarketPriceCursorPagination
+
     def get_queryset(self):
-        queryset = MarketPrice.objects.all().select_related('animal_type', 'breed').order_by('-date_recorded')
-        
+        queryset = MarketPrice.objects.all()
+
         animal_type_id = self.request.query_params.get('animal_type', None)
         location = self.request.query_params.get('location', None)
-        
+
         if animal_type_id is not None:
             queryset = queryset.filter(animal_type_id=animal_type_id)
-        
+
         if location is not None:
             queryset = queryset.filter(location__icontains=location)
-        
-        return queryset[:50]  # Limit to recent 50 records
+
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        # Pages are bounded at page_size rows, so project straight to dicts
+        # with values() - the paginator positions its cursor on the dict keys
+        rows = self.get_queryset().values(*MARKET_PRICE_VALUES_FIELDS)
+        page = self.paginate_queryset(rows)
+        data = [_build_market_price_dict(row) for row in page]
+        return self.get_paginated_response(data)
 
 
 @swagger_auto_schema(
@@ -237,27 +436,39 @@ def get_latest_market_prices(request):
     """
     animal_type_id = request.query_params.get('animal_type_id')
     location = request.query_params.get('location')
-    
-    queryset = MarketPrice.objects.all().select_related('animal_type', 'breed').order_by('-date_recorded')
-    
-    if animal_type_id:
-        queryset = queryset.filter(animal_type_id=animal_type_id)
-    
-    if location:
-        queryset = queryset.filter(location__icontains=location)
-    
-    # Get latest prices (last 30 days)
-    from datetime import date, timedelta
-    recent_date = date.today() - timedelta(days=30)
-    queryset = queryset.filter(date_recorded__gte=recent_date)[:20]
-    
-    serializer = MarketPriceSerializer(queryset, many=True)
-    
-    return Response({
-        'prices': serializer.data,
-        'count': queryset.count(),
-        'date_range': f"Last 30 days from {date.today()}"
-    }, status=status.HTTP_200_OK)
+
+    # Latest prices are small and slow-changing: serve the materialized
+    # payload from cache and only rescan MarketPrice on a miss. The key is
+    # version-prefixed and invalidated by MarketPrice save/delete signals.
+    cache_key = latest_market_prices_cache_key(animal_type_id, location)
+    payload = cache.get(cache_key)
+
+    if payload is None:
+        queryset = MarketPrice.objects.all().order_by('-date_recorded')
+
+        if animal_type_id:
+            queryset = queryset.filter(animal_type_id=animal_type_id)
+
+        if location:
+            queryset = queryset.filter(location__icontains=location)
+
+        # Get latest prices (last 30 days) - project straight to dicts with
+        # values() so no model instances or serializer fields are built per row
+        recent_date = date.today() - _THIRTY_DAYS
+        rows = queryset.filter(date_recorded__gte=recent_date).values(
+            *MARKET_PRICE_VALUES_FIELDS
+        )[:20]
+
+        prices = [_build_market_price_dict(row) for row in rows]
+
+        payload = {
+            'prices': prices,
+            'count': len(prices),
+            'date_range': f"Last 30 days from {date.today()}"
+        }
+        cache.set(cache_key, payload, 60 * 60)
+
+    return Response(payload, status=status.HTTP_200_OK)
 
 
 # Disease Monitoring API Views
@@ -289,15 +500,29 @@ def analyze_symptoms(request):
         livestock_id=serializer.validated_data.get('livestock_id')
     )
     
-    # Analyze symptoms using the service
+    # Analyze symptoms using the service; one pass yields both result sets
     service = DiseaseMonitoringService()
-    disease_results = service.analyze_symptoms(symptom_input)
-    critical_alerts = service.get_critical_alerts(symptom_input)
-    
-    # Get animal and symptom info
-    animal_type = get_object_or_404(AnimalType, id=symptom_input.animal_type_id)
-    input_symptoms = Symptom.objects.filter(id__in=symptom_input.symptoms)
+    disease_results, critical_alerts = service.analyze_full(symptom_input)
     
+    # Get animal and symptom info (cached; reference data changes rarely)
+    try:
+        animal_type = get_cached_animal_type(symptom_input.animal_type_id)
+    except AnimalType.DoesNotExist:
+        return Response(
+            {'error': 'Animal type not found'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+    # in_bulk + map rebuild keeps the response symptoms in input order;
+    # dict.fromkeys drops repeated ids so duplicate submissions do not
+    # duplicate entries in the response
+    symptom_map = Symptom.objects.in_bulk(symptom_input.symptoms)
+    input_symptoms = [
+        symptom_map[symptom_id]
+        for symptom_id in dict.fromkeys(symptom_input.symptoms)
+        if symptom_id in symptom_map
+    ]
+
+
     # Prepare response data
     response_data = {
         'animal_info': {
@@ -371,6 +596,7 @@ def get_critical_alerts(request):
     ],
     responses={200: PreventionRecommendationSerializer}
 )
+@cache_page(LOOKUP_CACHE_TTL)
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def get_prevention_recommendations(request):
@@ -411,6 +637,7 @@ def get_prevention_recommendations(request):
     ],
     responses={200: SymptomSuggestionSerializer(many=True)}
 )
+@cache_page(LOOKUP_CACHE_TTL)
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def get_symptom_suggestions(request):
@@ -482,10 +709,11 @@ def create_health_record(request):
         farmer=request.user
     )
     
-    # Create health record using service
+    # Create health record using service; the ownership check above already
+    # fetched the row, so hand the instance over instead of the id
     service = DiseaseMonitoringService()
     result = service.create_health_record(
-        livestock_id=serializer.validated_data['livestock_id'],
+        livestock=livestock,
         symptom_ids=serializer.validated_data['symptom_ids'],
         suspected_disease_id=serializer.validated_data.get('suspected_disease_id')
     )
@@ -522,8 +750,6 @@ def analyze_market_price(request):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
     # Use pricing service to analyze market
-    from .pricing_service import PricingAnalysisService, PriceAnalysisInput
-    
     price_input = PriceAnalysisInput(
         animal_type_id=serializer.validated_data['animal_type_id'],
         breed_id=serializer.validated_data.get('breed_id'),
@@ -531,13 +757,25 @@ def analyze_market_price(request):
         weight_kg=serializer.validated_data.get('weight_kg'),
         quality_grade=serializer.validated_data.get('quality_grade', 'AVERAGE')
     )
-    
+
+    # The analysis is a deterministic function of a small parameter space,
+    # so identical requests share a cached payload; the MarketPrice signals
+    # bump the version prefix whenever pricing data changes
+    cache_key = price_analysis_cache_key(
+        price_input.animal_type_id, price_input.breed_id, price_input.location,
+        price_input.quality_grade, price_input.weight_kg
+    )
+    cached_data = cache.get(cache_key)
+    if cached_data is not None:
+        return Response(cached_data, status=status.HTTP_200_OK)
+
     service = PricingAnalysisService()
     result = service.analyze_market_price(price_input)
-    
+
     # Serialize the result
     result_serializer = PriceAnalysisResultSerializer(result)
-    
+    cache.set(cache_key, result_serializer.data, 60 * 60)
+
     return Response(result_serializer.data, status=status.HTTP_200_OK)
 
 
@@ -568,18 +806,17 @@ def analyze_livestock_profitability(request, livestock_id):
     """
     Analyze profitability of a specific livestock animal
     """
-    # Verify livestock belongs to user
+    # Verify livestock belongs to user; the analysis walks animal_type and
+    # breed, so eager-load them with the same ownership query
     livestock = get_object_or_404(
-        Livestock, 
+        Livestock.objects.select_related('animal_type', 'breed'),
         id=livestock_id,
         farmer=request.user
     )
-    
+
     # Use pricing service to analyze profitability
-    from .pricing_service import PricingAnalysisService
-    
     service = PricingAnalysisService()
-    result = service.analyze_livestock_profitability(livestock_id)
+    result = service.analyze_livestock_profitability(livestock)
     
     if result is None:
         return Response(
@@ -602,10 +839,7 @@ def analyze_livestock_profitability(request, livestock_id):
             schema=openapi.Schema(
                 type=openapi.TYPE_OBJECT,
                 properties={
-                    'recommendations': openapi.Schema(
-                        type=openapi.TYPE_ARRAY,
-                        items=openapi.Schema(type=openapi.TYPE_OBJECT)
-                    ),
+                    'recommendations': OBJECT_ARRAY_SCHEMA,
                     'total_livestock': openapi.Schema(type=openapi.TYPE_INTEGER),
                     'high_priority_count': openapi.Schema(type=openapi.TYPE_INTEGER),
                     'total_potential_profit': openapi.Schema(type=openapi.TYPE_NUMBER)
@@ -620,14 +854,16 @@ def get_selling_recommendations(request):
     """
     Get selling recommendations for all farmer's livestock
     """
-    from .pricing_service import PricingAnalysisService
-    
     service = PricingAnalysisService()
     recommendations = service.get_selling_recommendations(request.user.id)
     
-    # Calculate summary statistics
-    high_priority_count = sum(1 for rec in recommendations if rec['action_priority'] >= 4)
-    total_potential_profit = sum(rec['profitability'].estimated_profit for rec in recommendations)
+    # Calculate summary statistics in one pass
+    high_priority_count = 0
+    total_potential_profit = 0.0
+    for rec in recommendations:
+        if rec['action_priority'] >= 4:
+            high_priority_count += 1
+        total_potential_profit += rec['profitability'].estimated_profit
     
     # Serialize recommendations
     recommendations_serializer = SellingRecommendationSerializer(recommendations, many=True)
@@ -672,10 +908,7 @@ def get_selling_recommendations(request):
             schema=openapi.Schema(
                 type=openapi.TYPE_OBJECT,
                 properties={
-                    'prices': openapi.Schema(
-                        type=openapi.TYPE_ARRAY,
-                        items=openapi.Schema(type=openapi.TYPE_OBJECT)
-                    ),
+                    'prices': OBJECT_ARRAY_SCHEMA,
                     'count': openapi.Schema(type=openapi.TYPE_INTEGER),
                     'average_price': openapi.Schema(type=openapi.TYPE_NUMBER),
                     'date_range': openapi.Schema(
@@ -696,9 +929,6 @@ def get_market_prices(request):
     """
     Get recent market prices for livestock
     """
-    from datetime import date, timedelta
-    from .models import MarketPrice
-    
     # Get query parameters
     animal_type_id = request.GET.get('animal_type_id')
     location = request.GET.get('location')
@@ -706,7 +936,7 @@ def get_market_prices(request):
     
     # Filter prices
     queryset = MarketPrice.objects.all()
-    
+
     if animal_type_id:
         queryset = queryset.filter(animal_type_id=animal_type_id)
     
@@ -716,18 +946,19 @@ def get_market_prices(request):
     # Filter by date range
     start_date = date.today() - timedelta(days=days)
     queryset = queryset.filter(date_recorded__gte=start_date).order_by('-date_recorded')
-    
-    # Serialize results
-    prices_serializer = MarketPriceSerializer(queryset, many=True)
-    
-    # Calculate statistics
-    prices = queryset.values_list('price_per_kg', flat=True)
-    average_price = sum(prices) / len(prices) if prices else 0
-    
+
+    # Project straight to dicts and build the payload without DRF field
+    # machinery; the count reuses the materialized rows
+    rows = list(queryset.values(*MARKET_PRICE_VALUES_FIELDS))
+    prices = [_build_market_price_dict(row) for row in rows]
+
+    # Let the database average the prices instead of looping over Decimals
+    stats = queryset.aggregate(avg=Avg('price_per_kg'))
+
     response_data = {
-        'prices': prices_serializer.data,
-        'count': queryset.count(),
-        'average_price': round(average_price, 2),
+        'prices': prices,
+        'count': len(rows),
+        'average_price': round(float(stats['avg'] or 0), 2),
         'date_range': {
             'from': start_date.strftime('%Y-%m-%d'),
             'to': date.today().strftime('%Y-%m-%d')
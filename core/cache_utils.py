@@ -0,0 +1,100 @@
+"""
+Cache helpers for expensive, deterministic service calls.
+"""
+import hashlib
+import json
+
+from django.core.cache import cache
+
+# Bumping a version key invalidates every cache entry built with it
+FEEDING_CACHE_VERSION_KEY = 'feed_rec:version'
+MARKET_PRICE_CACHE_VERSION_KEY = 'market_price:version'
+REFERENCE_CACHE_VERSION_KEY = 'reference_data:version'
+
+
+def _get_version(version_key):
+    return cache.get_or_set(version_key, 1, None)
+
+
+def _bump_version(version_key):
+    try:
+        cache.incr(version_key)
+    except ValueError:
+        cache.set(version_key, 1, None)
+
+
+def get_feeding_cache_version():
+    """Get the current feeding recommendation cache version"""
+    return _get_version(FEEDING_CACHE_VERSION_KEY)
+
+
+def bump_feeding_cache_version():
+    """Invalidate all cached feeding recommendations"""
+    _bump_version(FEEDING_CACHE_VERSION_KEY)
+
+
+def bump_market_price_cache_version():
+    """Invalidate all cached market price payloads"""
+    _bump_version(MARKET_PRICE_CACHE_VERSION_KEY)
+
+
+def latest_market_prices_cache_key(animal_type_id, location):
+    """Cache key for the latest-prices payload of one filter combination"""
+    version = _get_version(MARKET_PRICE_CACHE_VERSION_KEY)
+    return f'latest_prices:v{version}:{animal_type_id or "all"}:{location or "all"}'
+
+
+def get_reference_cache_version():
+    """Get the current reference-data cache version"""
+    return _get_version(REFERENCE_CACHE_VERSION_KEY)
+
+
+def bump_reference_cache_version():
+    """Invalidate all cached reference/lookup list payloads"""
+    _bump_version(REFERENCE_CACHE_VERSION_KEY)
+
+
+def reference_list_cache_key(name):
+    """Cache key for a reference/lookup list endpoint payload"""
+    return f'reference_list:v{get_reference_cache_version()}:{name}'
+
+
+def price_analysis_cache_key(animal_type_id, breed_id, location, quality_grade, weight_kg):
+    """Cache key for one market price analysis parameter combination"""
+    version = _get_version(MARKET_PRICE_CACHE_VERSION_KEY)
+    return (
+        f'price_analysis:v{version}:{animal_type_id}:{breed_id or "all"}'
+        f':{location or "all"}:{quality_grade}:{weight_kg or "any"}'
+    )
+
+
+def get_cached_animal_type(animal_type_id):
+    """
+    Fetch an AnimalType through the cache. The table is near-static, so
+    hot POST paths skip the per-request SELECT; the version prefix means
+    the AnimalType signals invalidate stale entries on any change.
+
+    Raises AnimalType.DoesNotExist like a plain .get() on a miss.
+    """
+    from .models import AnimalType
+
+    version = _get_version(REFERENCE_CACHE_VERSION_KEY)
+    key = f'animal_type:v{version}:{animal_type_id}'
+    animal_type = cache.get(key)
+    if animal_type is None:
+        animal_type = AnimalType.objects.get(id=animal_type_id)
+        cache.set(key, animal_type, 60 * 60)
+    return animal_type
+
+
+def feeding_recommendation_cache_key(input_data):
+    """
+    Build a deterministic cache key from validated feeding input data.
+    The same (animal_type, age, weight, purpose, livestock) tuple always
+    hashes to the same key regardless of dict ordering.
+    """
+    digest = hashlib.blake2b(
+        json.dumps(input_data, sort_keys=True, default=str).encode(),
+        digest_size=16
+    ).hexdigest()
+    return f'feed_rec:v{get_feeding_cache_version()}:{digest}'
@@ -1,8 +1,52 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Count, Q
 from datetime import date, timedelta
 from core.models import AnimalType, Breed, Livestock, FarmerProfile
 
+# Static sample herd, built once at import time; animal and breed names are
+# resolved against the lookup dicts handle() fetches per run
+SAMPLE_LIVESTOCK = (
+    # Cattle
+    {'animal': 'Cattle', 'breed': 'Holstein', 'tag_number': 'C001',
+     'name': 'Bessie', 'gender': 'F', 'purpose': 'MILK',
+     'weight': 450, 'age_days': 720, 'purchase_price': 1200},
+    {'animal': 'Cattle', 'breed': 'Angus', 'tag_number': 'C002',
+     'name': 'Thunder', 'gender': 'M', 'purpose': 'MEAT',
+     'weight': 380, 'age_days': 540, 'purchase_price': 900},
+    {'animal': 'Cattle', 'breed': 'Holstein', 'tag_number': 'C003',
+     'name': 'Daisy', 'gender': 'F', 'purpose': 'MILK',
+     'weight': 420, 'age_days': 650, 'purchase_price': 1100},
+
+    # Goats
+    {'animal': 'Goats', 'breed': 'Boer', 'tag_number': 'G001',
+     'name': 'Billy', 'gender': 'M', 'purpose': 'MEAT',
+     'weight': 45, 'age_days': 365, 'purchase_price': 150},
+    {'animal': 'Goats', 'breed': 'Nubian', 'tag_number': 'G002',
+     'name': 'Nanny', 'gender': 'F', 'purpose': 'MILK',
+     'weight': 55, 'age_days': 450, 'purchase_price': 200},
+    {'animal': 'Goats', 'breed': 'Boer', 'tag_number': 'G003',
+     'name': 'Kid', 'gender': 'F', 'purpose': 'BREEDING',
+     'weight': 35, 'age_days': 240, 'purchase_price': 180},
+
+    # Sheep
+    {'animal': 'Sheep', 'breed': 'Dorper', 'tag_number': 'S001',
+     'name': 'Woolly', 'gender': 'F', 'purpose': 'MEAT',
+     'weight': 60, 'age_days': 300, 'purchase_price': 120},
+    {'animal': 'Sheep', 'breed': 'Dorper', 'tag_number': 'S002',
+     'name': 'Ram', 'gender': 'M', 'purpose': 'BREEDING',
+     'weight': 75, 'age_days': 600, 'purchase_price': 200},
+
+    # Poultry
+    {'animal': 'Poultry', 'breed': 'Rhode Island Red', 'tag_number': 'P001',
+     'name': 'Henrietta', 'gender': 'F', 'purpose': 'EGGS',
+     'weight': 2.2, 'age_days': 120, 'purchase_price': 15},
+    {'animal': 'Poultry', 'breed': 'Rhode Island Red', 'tag_number': 'P002',
+     'name': 'Rooster', 'gender': 'M', 'purpose': 'BREEDING',
+     'weight': 3.0, 'age_days': 180, 'purchase_price': 25},
+)
+
 
 class Command(BaseCommand):
     help = 'Create sample livestock for existing users'
@@ -19,10 +63,21 @@ class Command(BaseCommand):
             help='Clear existing sample livestock before creating new ones',
         )
 
+    # One commit for the whole run instead of an fsync per write
+    @transaction.atomic
     def handle(self, *args, **options):
         username = options.get('username')
         clear_existing = options.get('clear', False)
-        
+
+        # Per-row creation lines are syscall-bound on large seeds, so they
+        # only print at verbosity 2+
+        self.verbose = int(options.get('verbosity', 1)) >= 2
+
+        # Sample ages are static, so each distinct age resolves to dates once
+        # per run instead of two timedelta subtractions per row per user
+        self._today = date.today()
+        self._age_to_dates = {}
+
         self.stdout.write(self.style.SUCCESS('Creating sample livestock...'))
         
         # Get users
@@ -34,16 +89,18 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.ERROR(f'User "{username}" not found'))
                 return
         else:
-            users = User.objects.all()
-            if not users.exists():
+            # Only the columns the command touches, streamed in chunks so a
+            # large user table never has to fit in memory at once
+            user_qs = User.objects.only('id', 'username')
+            if user_qs.first() is None:
                 self.stdout.write(self.style.ERROR('No users found in the system'))
                 return
+            users = user_qs.iterator(chunk_size=500)
         
         # Clear existing sample livestock if requested
         if clear_existing:
-            deleted_count = Livestock.objects.filter(
-                notes__contains='Sample livestock created for testing'
-            ).delete()[0]
+            # Indexed boolean filter; notes__contains would LIKE-scan the table
+            deleted_count = Livestock.objects.filter(is_sample=True).delete()[0]
             self.stdout.write(f'Deleted {deleted_count} existing sample livestock')
         
         # Check if required data exists
@@ -56,138 +113,93 @@ class Command(BaseCommand):
             )
             return
         
-        # Create livestock for users
+        # Resolve the reference rows once; they are identical for every user
+        animal_types = {
+            a.name: a
+            for a in AnimalType.objects.filter(name__in=self.REQUIRED_ANIMALS)
+        }
+        breeds = {
+            (b.animal_type_id, b.name): b
+            for b in Breed.objects.select_related('animal_type').filter(name__in=self.REQUIRED_BREEDS)
+        }
+
+        # Ids of users that already have a profile, so missing ones can be
+        # collected during the single pass and inserted in one INSERT
+        existing_profile_user_ids = set(
+            FarmerProfile.objects.values_list('user_id', flat=True)
+        )
+
+        new_profiles = []
+        processed = 0
+        batch_users = []
+        batch_rows = []
         for user in users:
-            self.create_livestock_for_user(user)
-        
+            if user.id not in existing_profile_user_ids:
+                new_profiles.append(FarmerProfile(
+                    user=user,
+                    location='Sample Farm Location',
+                    farm_size_acres=50.0,
+                    experience_years=5
+                ))
+            batch_users.append(user)
+            batch_rows.extend(self.build_livestock_rows(user, animal_types, breeds))
+            processed += 1
+
+            # Flush once per chunk so round trips scale with chunks, not users
+            if len(batch_users) >= 500:
+                self.flush_livestock_batch(batch_users, batch_rows)
+                batch_users, batch_rows = [], []
+
+        if batch_users:
+            self.flush_livestock_batch(batch_users, batch_rows)
+
+        FarmerProfile.objects.bulk_create(new_profiles, ignore_conflicts=True)
+        for profile in new_profiles:
+            self.log_row(f'Created farmer profile for: {profile.user.username}')
+
         self.stdout.write(
             self.style.SUCCESS(
-                f'Sample livestock creation completed for {len(users)} user(s)!'
+                f'Sample livestock creation completed for {processed} user(s)!'
             )
         )
 
+    REQUIRED_ANIMALS = ['Cattle', 'Goats', 'Sheep', 'Poultry']
+    REQUIRED_BREEDS = ['Holstein', 'Angus', 'Boer', 'Nubian', 'Dorper', 'Rhode Island Red']
+
+    def log_row(self, message):
+        """Per-row creation detail, emitted only at verbosity 2+"""
+        if self.verbose:
+            self.stdout.write(message)
+
     def check_required_data(self):
         """Check if required animal types and breeds exist"""
-        required_animals = ['Cattle', 'Goats', 'Sheep', 'Poultry']
-        required_breeds = ['Holstein', 'Angus', 'Boer', 'Nubian', 'Dorper', 'Rhode Island Red']
-        
-        existing_animals = AnimalType.objects.filter(name__in=required_animals).count()
-        existing_breeds = Breed.objects.filter(name__in=required_breeds).count()
-        
-        return existing_animals >= 4 and existing_breeds >= 6
-
-    def create_livestock_for_user(self, user):
-        """Create sample livestock for a specific user"""
-        
-        # Create farmer profile if it doesn't exist
-        farmer_profile, profile_created = FarmerProfile.objects.get_or_create(
-            user=user,
-            defaults={
-                'location': 'Sample Farm Location',
-                'farm_size_acres': 50.0,
-                'experience_years': 5
-            }
+        # One aggregate over the breed/animal-type join instead of a COUNT
+        # round trip per table
+        stats = Breed.objects.aggregate(
+            breeds=Count('id', filter=Q(name__in=self.REQUIRED_BREEDS)),
+            animals=Count(
+                'animal_type__name',
+                filter=Q(animal_type__name__in=self.REQUIRED_ANIMALS),
+                distinct=True
+            ),
         )
-        
-        if profile_created:
-            self.stdout.write(f'Created farmer profile for: {user.username}')
-        
-        # Get animal types and breeds
-        try:
-            cattle = AnimalType.objects.get(name='Cattle')
-            goats = AnimalType.objects.get(name='Goats')
-            sheep = AnimalType.objects.get(name='Sheep')
-            poultry = AnimalType.objects.get(name='Poultry')
-            
-            holstein = Breed.objects.get(name='Holstein', animal_type=cattle)
-            angus = Breed.objects.get(name='Angus', animal_type=cattle)
-            boer = Breed.objects.get(name='Boer', animal_type=goats)
-            nubian = Breed.objects.get(name='Nubian', animal_type=goats)
-            dorper = Breed.objects.get(name='Dorper', animal_type=sheep)
-            rhode_island = Breed.objects.get(name='Rhode Island Red', animal_type=poultry)
-        except (AnimalType.DoesNotExist, Breed.DoesNotExist) as e:
-            self.stdout.write(self.style.ERROR(f'Required data not found: {e}'))
-            return
-        
-        # Sample livestock data
-        sample_livestock = [
-            # Cattle
-            {
-                'animal_type': cattle, 'breed': holstein, 'tag_number': 'C001', 
-                'name': 'Bessie', 'gender': 'F', 'purpose': 'MILK', 
-                'weight': 450, 'age_days': 720, 'purchase_price': 1200
-            },
-            {
-                'animal_type': cattle, 'breed': angus, 'tag_number': 'C002', 
-                'name': 'Thunder', 'gender': 'M', 'purpose': 'MEAT', 
-                'weight': 380, 'age_days': 540, 'purchase_price': 900
-            },
-            {
-                'animal_type': cattle, 'breed': holstein, 'tag_number': 'C003', 
-                'name': 'Daisy', 'gender': 'F', 'purpose': 'MILK', 
-                'weight': 420, 'age_days': 650, 'purchase_price': 1100
-            },
-            
-            # Goats
-            {
-                'animal_type': goats, 'breed': boer, 'tag_number': 'G001', 
-                'name': 'Billy', 'gender': 'M', 'purpose': 'MEAT', 
-                'weight': 45, 'age_days': 365, 'purchase_price': 150
-            },
-            {
-                'animal_type': goats, 'breed': nubian, 'tag_number': 'G002', 
-                'name': 'Nanny', 'gender': 'F', 'purpose': 'MILK', 
-                'weight': 55, 'age_days': 450, 'purchase_price': 200
-            },
-            {
-                'animal_type': goats, 'breed': boer, 'tag_number': 'G003', 
-                'name': 'Kid', 'gender': 'F', 'purpose': 'BREEDING', 
-                'weight': 35, 'age_days': 240, 'purchase_price': 180
-            },
-            
-            # Sheep
-            {
-                'animal_type': sheep, 'breed': dorper, 'tag_number': 'S001', 
-                'name': 'Woolly', 'gender': 'F', 'purpose': 'MEAT', 
-                'weight': 60, 'age_days': 300, 'purchase_price': 120
-            },
-            {
-                'animal_type': sheep, 'breed': dorper, 'tag_number': 'S002', 
-                'name': 'Ram', 'gender': 'M', 'purpose': 'BREEDING', 
-                'weight': 75, 'age_days': 600, 'purchase_price': 200
-            },
-            
-            # Poultry
-            {
-                'animal_type': poultry, 'breed': rhode_island, 'tag_number': 'P001', 
-                'name': 'Henrietta', 'gender': 'F', 'purpose': 'EGGS', 
-                'weight': 2.2, 'age_days': 120, 'purchase_price': 15
-            },
-            {
-                'animal_type': poultry, 'breed': rhode_island, 'tag_number': 'P002', 
-                'name': 'Rooster', 'gender': 'M', 'purpose': 'BREEDING', 
-                'weight': 3.0, 'age_days': 180, 'purchase_price': 25
-            },
-        ]
-        
-        created_count = 0
-        
-        for livestock_data in sample_livestock:
+
+        return stats['animals'] >= 4 and stats['breeds'] >= 6
+
+    def build_livestock_rows(self, user, animal_types, breeds):
+        """Build the unsaved sample Livestock rows for one user"""
+        rows = []
+        for livestock_data in SAMPLE_LIVESTOCK:
             # Make tag number unique per user
             unique_tag = f"{user.id}_{livestock_data['tag_number']}"
-            
-            # Skip if livestock with this tag already exists for this user
-            if Livestock.objects.filter(farmer=user, tag_number=unique_tag).exists():
-                continue
-            
-            # Calculate birth date
-            birth_date = date.today() - timedelta(days=livestock_data['age_days'])
-            purchase_date = birth_date + timedelta(days=30)  # Assume purchased 30 days after birth
-            
-            livestock = Livestock.objects.create(
+
+            birth_date, purchase_date = self._dates_for_age(livestock_data['age_days'])
+            animal_type = animal_types[livestock_data['animal']]
+
+            rows.append(Livestock(
                 farmer=user,
-                animal_type=livestock_data['animal_type'],
-                breed=livestock_data['breed'],
+                animal_type=animal_type,
+                breed=breeds[(animal_type.id, livestock_data['breed'])],
                 tag_number=unique_tag,
                 name=livestock_data['name'],
                 gender=livestock_data['gender'],
@@ -197,13 +209,42 @@ class Command(BaseCommand):
                 status='HEALTHY',
                 purchase_date=purchase_date,
                 purchase_price=livestock_data['purchase_price'],
-                notes=f'Sample livestock created for testing - {livestock_data["name"]}'
-            )
-            
-            created_count += 1
-            self.stdout.write(f'Created livestock for {user.username}: {livestock.name} ({livestock.tag_number})')
-        
-        if created_count == 0:
-            self.stdout.write(f'No new livestock created for {user.username} (all already exist)')
-        else:
-            self.stdout.write(self.style.SUCCESS(f'Created {created_count} livestock for {user.username}'))
+                notes=f'Sample livestock created for testing - {livestock_data["name"]}',
+                is_sample=True
+            ))
+        return rows
+
+    def _dates_for_age(self, age_days):
+        """Birth and purchase dates for one sample age, memoized per run"""
+        dates = self._age_to_dates.get(age_days)
+        if dates is None:
+            birth_date = self._today - timedelta(days=age_days)
+            # Assume purchased 30 days after birth
+            dates = (birth_date, birth_date + timedelta(days=30))
+            self._age_to_dates[age_days] = dates
+        return dates
+
+    def flush_livestock_batch(self, batch_users, rows):
+        """Insert one chunk of users' rows: one tag SELECT, one INSERT"""
+        existing_tags = set(Livestock.objects.filter(
+            tag_number__in=[row.tag_number for row in rows]
+        ).values_list('tag_number', flat=True))
+
+        created = Livestock.objects.bulk_create(
+            [row for row in rows if row.tag_number not in existing_tags],
+            batch_size=500, ignore_conflicts=True
+        )
+
+        created_by_farmer = {}
+        for livestock in created:
+            created_by_farmer.setdefault(livestock.farmer_id, []).append(livestock)
+
+        for user in batch_users:
+            user_created = created_by_farmer.get(user.id, [])
+            for livestock in user_created:
+                self.log_row(f'Created livestock for {user.username}: {livestock.name} ({livestock.tag_number})')
+
+            if not user_created:
+                self.log_row(f'No new livestock created for {user.username} (all already exist)')
+            else:
+                self.stdout.write(self.style.SUCCESS(f'Created {len(user_created)} livestock for {user.username}'))
@@ -1,16 +1,270 @@
+import os
+import random
+
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import User
+from django.db import connection, transaction
 from datetime import date, timedelta
 from core.models import (
     AnimalType, Breed, FeedType, FeedingRecommendation, 
     Disease, Symptom, MarketPrice, Livestock, FarmerProfile
 )
 
+# Static seed data, built once at import time instead of as fresh literals
+# on every handle() call; animal, breed, feed and disease names are resolved
+# against lookup dicts fetched per run
+
+ANIMAL_TYPES = (
+    {
+        'name': 'Cattle',
+        'description': 'Domesticated bovine animals raised for meat, milk, and other dairy products'
+    },
+    {
+        'name': 'Goats',
+        'description': 'Small ruminants raised for meat, milk, and fiber'
+    },
+    {
+        'name': 'Sheep',
+        'description': 'Woolly ruminants raised for meat, wool, and milk'
+    },
+    {
+        'name': 'Poultry',
+        'description': 'Domesticated birds raised for eggs, meat, and feathers'
+    },
+)
+
+BREEDS_DATA = {
+    'Cattle': (
+        {'name': 'Holstein', 'avg_weight': 650, 'maturity': 24},
+        {'name': 'Angus', 'avg_weight': 550, 'maturity': 20},
+        {'name': 'Brahman', 'avg_weight': 500, 'maturity': 22},
+        {'name': 'Jersey', 'avg_weight': 400, 'maturity': 20},
+    ),
+    'Goats': (
+        {'name': 'Boer', 'avg_weight': 70, 'maturity': 8},
+        {'name': 'Nubian', 'avg_weight': 65, 'maturity': 10},
+        {'name': 'Saanen', 'avg_weight': 60, 'maturity': 9},
+        {'name': 'Kiko', 'avg_weight': 55, 'maturity': 7},
+    ),
+    'Sheep': (
+        {'name': 'Dorper', 'avg_weight': 80, 'maturity': 8},
+        {'name': 'Merino', 'avg_weight': 65, 'maturity': 9},
+        {'name': 'Suffolk', 'avg_weight': 90, 'maturity': 8},
+        {'name': 'Romney', 'avg_weight': 70, 'maturity': 9},
+    ),
+    'Poultry': (
+        {'name': 'Rhode Island Red', 'avg_weight': 3, 'maturity': 5},
+        {'name': 'Leghorn', 'avg_weight': 2.5, 'maturity': 4},
+        {'name': 'Broiler', 'avg_weight': 2.8, 'maturity': 2},
+        {'name': 'Sussex', 'avg_weight': 3.2, 'maturity': 5},
+    ),
+}
+
+FEED_TYPES = (
+    # Hay
+    {'name': 'Alfalfa Hay', 'category': 'HAY', 'protein': 18.0, 'energy': 8.5, 'cost': 0.25},
+    {'name': 'Timothy Hay', 'category': 'HAY', 'protein': 12.0, 'energy': 7.8, 'cost': 0.20},
+    {'name': 'Grass Hay', 'category': 'HAY', 'protein': 10.0, 'energy': 7.2, 'cost': 0.18},
+
+    # Grains
+    {'name': 'Corn', 'category': 'GRAIN', 'protein': 9.0, 'energy': 14.2, 'cost': 0.15},
+    {'name': 'Barley', 'category': 'GRAIN', 'protein': 12.0, 'energy': 13.8, 'cost': 0.18},
+    {'name': 'Wheat', 'category': 'GRAIN', 'protein': 14.0, 'energy': 13.5, 'cost': 0.22},
+
+    # Pellets
+    {'name': 'Cattle Pellets', 'category': 'PELLETS', 'protein': 16.0, 'energy': 11.5, 'cost': 0.35},
+    {'name': 'Goat Pellets', 'category': 'PELLETS', 'protein': 14.0, 'energy': 10.8, 'cost': 0.40},
+    {'name': 'Sheep Pellets', 'category': 'PELLETS', 'protein': 13.0, 'energy': 10.5, 'cost': 0.38},
+    {'name': 'Poultry Feed', 'category': 'PELLETS', 'protein': 18.0, 'energy': 12.2, 'cost': 0.45},
+
+    # Pasture
+    {'name': 'Fresh Pasture', 'category': 'PASTURE', 'protein': 15.0, 'energy': 9.5, 'cost': 0.05},
+
+    # Supplements
+    {'name': 'Mineral Mix', 'category': 'SUPPLEMENT', 'protein': 0.0, 'energy': 0.0, 'cost': 1.20},
+    {'name': 'Vitamin Supplement', 'category': 'SUPPLEMENT', 'protein': 0.0, 'energy': 0.0, 'cost': 2.50},
+)
+
+FEED_SUITABILITY = {
+    'Alfalfa Hay': ('Cattle', 'Goats', 'Sheep'),
+    'Timothy Hay': ('Cattle', 'Goats', 'Sheep'),
+    'Grass Hay': ('Cattle', 'Goats', 'Sheep'),
+    'Corn': ('Cattle', 'Goats', 'Sheep', 'Poultry'),
+    'Barley': ('Cattle', 'Goats', 'Sheep', 'Poultry'),
+    'Wheat': ('Cattle', 'Goats', 'Sheep', 'Poultry'),
+    'Cattle Pellets': ('Cattle',),
+    'Goat Pellets': ('Goats',),
+    'Sheep Pellets': ('Sheep',),
+    'Poultry Feed': ('Poultry',),
+    'Fresh Pasture': ('Cattle', 'Goats', 'Sheep'),
+    'Mineral Mix': ('Cattle', 'Goats', 'Sheep'),
+    'Vitamin Supplement': ('Cattle', 'Goats', 'Sheep', 'Poultry'),
+}
+
+FEEDING_RECOMMENDATIONS = (
+    # Cattle recommendations
+    {'animal': 'Cattle', 'feed': 'Alfalfa Hay', 'min_age': 0, 'max_age': 6, 'min_weight': 0, 'max_weight': 150, 'purpose': 'MILK', 'amount': 5.0, 'frequency': 2},
+    {'animal': 'Cattle', 'feed': 'Cattle Pellets', 'min_age': 6, 'max_age': 24, 'min_weight': 150, 'max_weight': 500, 'purpose': 'MEAT', 'amount': 8.0, 'frequency': 2},
+    {'animal': 'Cattle', 'feed': 'Fresh Pasture', 'min_age': 3, 'max_age': None, 'min_weight': 100, 'max_weight': None, 'purpose': '', 'amount': 25.0, 'frequency': 1},
+
+    # Goat recommendations
+    {'animal': 'Goats', 'feed': 'Alfalfa Hay', 'min_age': 0, 'max_age': 12, 'min_weight': 0, 'max_weight': 30, 'purpose': 'MILK', 'amount': 1.5, 'frequency': 2},
+    {'animal': 'Goats', 'feed': 'Goat Pellets', 'min_age': 3, 'max_age': None, 'min_weight': 15, 'max_weight': None, 'purpose': 'MEAT', 'amount': 1.0, 'frequency': 2},
+    {'animal': 'Goats', 'feed': 'Fresh Pasture', 'min_age': 2, 'max_age': None, 'min_weight': 10, 'max_weight': None, 'purpose': '', 'amount': 3.0, 'frequency': 1},
+
+    # Sheep recommendations
+    {'animal': 'Sheep', 'feed': 'Alfalfa Hay', 'min_age': 0, 'max_age': 8, 'min_weight': 0, 'max_weight': 40, 'purpose': 'MEAT', 'amount': 2.0, 'frequency': 2},
+    {'animal': 'Sheep', 'feed': 'Sheep Pellets', 'min_age': 4, 'max_age': None, 'min_weight': 20, 'max_weight': None, 'purpose': 'MEAT', 'amount': 1.2, 'frequency': 2},
+    {'animal': 'Sheep', 'feed': 'Fresh Pasture', 'min_age': 2, 'max_age': None, 'min_weight': 15, 'max_weight': None, 'purpose': '', 'amount': 4.0, 'frequency': 1},
+
+    # Poultry recommendations
+    {'animal': 'Poultry', 'feed': 'Poultry Feed', 'min_age': 0, 'max_age': 2, 'min_weight': 0, 'max_weight': 1, 'purpose': 'EGGS', 'amount': 0.12, 'frequency': 2},
+    {'animal': 'Poultry', 'feed': 'Poultry Feed', 'min_age': 2, 'max_age': None, 'min_weight': 1, 'max_weight': None, 'purpose': 'MEAT', 'amount': 0.15, 'frequency': 3},
+)
+
+DISEASES_DATA = (
+    {
+        'name': 'Foot and Mouth Disease',
+        'description': 'Highly contagious viral disease affecting cloven-hoofed animals',
+        'animals': ('Cattle', 'Goats', 'Sheep'),
+        'severity': 'CRITICAL',
+        'contagious': True,
+        'vet_required': True,
+        'prevention': 'Vaccination, quarantine new animals, proper sanitation',
+        'treatment': 'Supportive care, isolation, veterinary supervision'
+    },
+    {
+        'name': 'Mastitis',
+        'description': 'Inflammation of the mammary gland, common in dairy animals',
+        'animals': ('Cattle', 'Goats', 'Sheep'),
+        'severity': 'MEDIUM',
+        'contagious': False,
+        'vet_required': True,
+        'prevention': 'Proper milking hygiene, dry cow treatment',
+        'treatment': 'Antibiotics, anti-inflammatory drugs, improved hygiene'
+    },
+    {
+        'name': 'Newcastle Disease',
+        'description': 'Viral disease affecting poultry respiratory and nervous systems',
+        'animals': ('Poultry',),
+        'severity': 'HIGH',
+        'contagious': True,
+        'vet_required': True,
+        'prevention': 'Vaccination, biosecurity measures',
+        'treatment': 'Supportive care, isolation of affected birds'
+    },
+    {
+        'name': 'Parasitic Worms',
+        'description': 'Internal parasites affecting digestive system',
+        'animals': ('Cattle', 'Goats', 'Sheep'),
+        'severity': 'MEDIUM',
+        'contagious': False,
+        'vet_required': False,
+        'prevention': 'Regular deworming, pasture rotation, fecal testing',
+        'treatment': 'Anthelmintic medications, improved nutrition'
+    },
+    {
+        'name': 'Coccidiosis',
+        'description': 'Parasitic disease affecting the intestinal tract',
+        'animals': ('Poultry', 'Goats', 'Sheep'),
+        'severity': 'MEDIUM',
+        'contagious': True,
+        'vet_required': False,
+        'prevention': 'Clean water, dry bedding, proper sanitation',
+        'treatment': 'Anticoccidial drugs, supportive care'
+    },
+)
+
+SYMPTOMS_DATA = (
+    {'name': 'Fever', 'diseases': ('Foot and Mouth Disease', 'Newcastle Disease')},
+    {'name': 'Loss of Appetite', 'diseases': ('Foot and Mouth Disease', 'Newcastle Disease', 'Parasitic Worms', 'Coccidiosis')},
+    {'name': 'Lameness', 'diseases': ('Foot and Mouth Disease',)},
+    {'name': 'Blisters on mouth/feet', 'diseases': ('Foot and Mouth Disease',)},
+    {'name': 'Swollen udder', 'diseases': ('Mastitis',)},
+    {'name': 'Abnormal milk', 'diseases': ('Mastitis',)},
+    {'name': 'Respiratory distress', 'diseases': ('Newcastle Disease',)},
+    {'name': 'Diarrhea', 'diseases': ('Parasitic Worms', 'Coccidiosis')},
+    {'name': 'Weight loss', 'diseases': ('Parasitic Worms', 'Coccidiosis')},
+    {'name': 'Pale mucous membranes', 'diseases': ('Parasitic Worms',)},
+    {'name': 'Blood in droppings', 'diseases': ('Coccidiosis',)},
+    {'name': 'Sudden death', 'diseases': ('Newcastle Disease', 'Coccidiosis')},
+)
+
+SAMPLE_LIVESTOCK = (
+    # Cattle
+    {'animal': 'Cattle', 'breed': 'Holstein', 'tag_number': 'C001',
+     'name': 'Bessie', 'gender': 'F', 'purpose': 'MILK',
+     'weight': 450, 'age_days': 720, 'purchase_price': 1200},
+    {'animal': 'Cattle', 'breed': 'Angus', 'tag_number': 'C002',
+     'name': 'Thunder', 'gender': 'M', 'purpose': 'MEAT',
+     'weight': 380, 'age_days': 540, 'purchase_price': 900},
+    {'animal': 'Cattle', 'breed': 'Holstein', 'tag_number': 'C003',
+     'name': 'Daisy', 'gender': 'F', 'purpose': 'MILK',
+     'weight': 420, 'age_days': 650, 'purchase_price': 1100},
+
+    # Goats
+    {'animal': 'Goats', 'breed': 'Boer', 'tag_number': 'G001',
+     'name': 'Billy', 'gender': 'M', 'purpose': 'MEAT',
+     'weight': 45, 'age_days': 365, 'purchase_price': 150},
+    {'animal': 'Goats', 'breed': 'Nubian', 'tag_number': 'G002',
+     'name': 'Nanny', 'gender': 'F', 'purpose': 'MILK',
+     'weight': 55, 'age_days': 450, 'purchase_price': 200},
+    {'animal': 'Goats', 'breed': 'Boer', 'tag_number': 'G003',
+     'name': 'Kid', 'gender': 'F', 'purpose': 'BREEDING',
+     'weight': 35, 'age_days': 240, 'purchase_price': 180},
+
+    # Sheep
+    {'animal': 'Sheep', 'breed': 'Dorper', 'tag_number': 'S001',
+     'name': 'Woolly', 'gender': 'F', 'purpose': 'MEAT',
+     'weight': 60, 'age_days': 300, 'purchase_price': 120},
+    {'animal': 'Sheep', 'breed': 'Dorper', 'tag_number': 'S002',
+     'name': 'Ram', 'gender': 'M', 'purpose': 'BREEDING',
+     'weight': 75, 'age_days': 600, 'purchase_price': 200},
+
+    # Poultry
+    {'animal': 'Poultry', 'breed': 'Rhode Island Red', 'tag_number': 'P001',
+     'name': 'Henrietta', 'gender': 'F', 'purpose': 'EGGS',
+     'weight': 2.2, 'age_days': 120, 'purchase_price': 15},
+    {'animal': 'Poultry', 'breed': 'Rhode Island Red', 'tag_number': 'P002',
+     'name': 'Rooster', 'gender': 'M', 'purpose': 'BREEDING',
+     'weight': 3.0, 'age_days': 180, 'purchase_price': 25},
+)
+
 
 class Command(BaseCommand):
     help = 'Seed database with initial livestock management data'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=int(os.environ.get('SEED_BATCH_SIZE', '500')),
+            help='Rows per INSERT statement; tune per database engine',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Reseed even if the database already contains seed data',
+        )
+
+    # One commit for the whole seed instead of an fsync per write; an
+    # unexpected error rolls back to a clean database
+    @transaction.atomic
     def handle(self, *args, **options):
+        # Per-row creation lines are syscall-bound on large seeds, so they
+        # only print at verbosity 2+
+        self.verbose = int(options.get('verbosity', 1)) >= 2
+        self.batch_size = options['batch_size']
+
+        # Sentinel short-circuit: one EXISTS instead of walking every table
+        # on an already-seeded database; --force reseeds (and refreshes the
+        # upserted reference rows)
+        if not options.get('force') and AnimalType.objects.filter(name='Cattle').exists():
+            self.stdout.write(
+                'Database already seeded; pass --force to reseed.'
+            )
+            return
+
         self.stdout.write(self.style.SUCCESS('Starting data seeding...'))
         
         # Create Animal Types
@@ -36,471 +290,359 @@ class Command(BaseCommand):
         
         self.stdout.write(self.style.SUCCESS('Data seeding completed successfully!'))
 
-    def create_animal_types(self):
-        animal_types = [
-            {
-                'name': 'Cattle',
-                'description': 'Domesticated bovine animals raised for meat, milk, and other dairy products'
-            },
-            {
-                'name': 'Goats', 
-                'description': 'Small ruminants raised for meat, milk, and fiber'
-            },
-            {
-                'name': 'Sheep',
-                'description': 'Woolly ruminants raised for meat, wool, and milk'
-            },
-            {
-                'name': 'Poultry',
-                'description': 'Domesticated birds raised for eggs, meat, and feathers'
-            },
-        ]
-        
-        for animal_data in animal_types:
-            animal_type, created = AnimalType.objects.get_or_create(
-                name=animal_data['name'],
-                defaults={'description': animal_data['description']}
+    def log_row(self, message):
+        """Per-row creation detail, emitted only at verbosity 2+"""
+        if self.verbose:
+            self.stdout.write(message)
+
+    def upsert(self, model, rows, unique_fields, update_fields):
+        """
+        Insert-or-update rows with one INSERT .. ON CONFLICT DO UPDATE
+        where the backend supports it; otherwise insert the missing rows
+        and leave existing ones untouched.
+        """
+        if connection.features.supports_update_conflicts_with_target:
+            return model.objects.bulk_create(
+                rows,
+                batch_size=self.batch_size,
+                update_conflicts=True,
+                unique_fields=unique_fields,
+                update_fields=update_fields,
             )
-            if created:
-                self.stdout.write(f'Created animal type: {animal_type.name}')
+        return model.objects.bulk_create(rows, batch_size=self.batch_size, ignore_conflicts=True)
+
+    def create_animal_types(self):
+        # One upsert statement covers both fresh and repeat seeds
+        seeded = self.upsert(
+            AnimalType,
+            [AnimalType(name=a['name'], description=a['description']) for a in ANIMAL_TYPES],
+            unique_fields=['name'],
+            update_fields=['description'],
+        )
+        for animal_type in seeded:
+            self.log_row(f'Seeded animal type: {animal_type.name}')
+        self.stdout.write(f'Seeded {len(seeded)} animal types')
 
     def create_breeds(self):
-        breeds_data = {
-            'Cattle': [
-                {'name': 'Holstein', 'avg_weight': 650, 'maturity': 24},
-                {'name': 'Angus', 'avg_weight': 550, 'maturity': 20},
-                {'name': 'Brahman', 'avg_weight': 500, 'maturity': 22},
-                {'name': 'Jersey', 'avg_weight': 400, 'maturity': 20},
-            ],
-            'Goats': [
-                {'name': 'Boer', 'avg_weight': 70, 'maturity': 8},
-                {'name': 'Nubian', 'avg_weight': 65, 'maturity': 10},
-                {'name': 'Saanen', 'avg_weight': 60, 'maturity': 9},
-                {'name': 'Kiko', 'avg_weight': 55, 'maturity': 7},
-            ],
-            'Sheep': [
-                {'name': 'Dorper', 'avg_weight': 80, 'maturity': 8},
-                {'name': 'Merino', 'avg_weight': 65, 'maturity': 9},
-                {'name': 'Suffolk', 'avg_weight': 90, 'maturity': 8},
-                {'name': 'Romney', 'avg_weight': 70, 'maturity': 9},
-            ],
-            'Poultry': [
-                {'name': 'Rhode Island Red', 'avg_weight': 3, 'maturity': 5},
-                {'name': 'Leghorn', 'avg_weight': 2.5, 'maturity': 4},
-                {'name': 'Broiler', 'avg_weight': 2.8, 'maturity': 2},
-                {'name': 'Sussex', 'avg_weight': 3.2, 'maturity': 5},
-            ],
+        animal_types = {
+            a.name: a for a in AnimalType.objects.filter(name__in=BREEDS_DATA)
         }
-        
-        for animal_name, breeds in breeds_data.items():
-            animal_type = AnimalType.objects.get(name=animal_name)
-            for breed_data in breeds:
-                breed, created = Breed.objects.get_or_create(
-                    animal_type=animal_type,
-                    name=breed_data['name'],
-                    defaults={
-                        'average_weight_kg': breed_data['avg_weight'],
-                        'maturity_months': breed_data['maturity']
-                    }
-                )
-                if created:
-                    self.stdout.write(f'Created breed: {animal_type.name} - {breed.name}')
 
-    def create_feed_types(self):
-        feed_types = [
-            # Hay
-            {'name': 'Alfalfa Hay', 'category': 'HAY', 'protein': 18.0, 'energy': 8.5, 'cost': 0.25},
-            {'name': 'Timothy Hay', 'category': 'HAY', 'protein': 12.0, 'energy': 7.8, 'cost': 0.20},
-            {'name': 'Grass Hay', 'category': 'HAY', 'protein': 10.0, 'energy': 7.2, 'cost': 0.18},
-            
-            # Grains
-            {'name': 'Corn', 'category': 'GRAIN', 'protein': 9.0, 'energy': 14.2, 'cost': 0.15},
-            {'name': 'Barley', 'category': 'GRAIN', 'protein': 12.0, 'energy': 13.8, 'cost': 0.18},
-            {'name': 'Wheat', 'category': 'GRAIN', 'protein': 14.0, 'energy': 13.5, 'cost': 0.22},
-            
-            # Pellets
-            {'name': 'Cattle Pellets', 'category': 'PELLETS', 'protein': 16.0, 'energy': 11.5, 'cost': 0.35},
-            {'name': 'Goat Pellets', 'category': 'PELLETS', 'protein': 14.0, 'energy': 10.8, 'cost': 0.40},
-            {'name': 'Sheep Pellets', 'category': 'PELLETS', 'protein': 13.0, 'energy': 10.5, 'cost': 0.38},
-            {'name': 'Poultry Feed', 'category': 'PELLETS', 'protein': 18.0, 'energy': 12.2, 'cost': 0.45},
-            
-            # Pasture
-            {'name': 'Fresh Pasture', 'category': 'PASTURE', 'protein': 15.0, 'energy': 9.5, 'cost': 0.05},
-            
-            # Supplements
-            {'name': 'Mineral Mix', 'category': 'SUPPLEMENT', 'protein': 0.0, 'energy': 0.0, 'cost': 1.20},
-            {'name': 'Vitamin Supplement', 'category': 'SUPPLEMENT', 'protein': 0.0, 'energy': 0.0, 'cost': 2.50},
-        ]
-        
-        # Get animal types for suitable_for relationships
-        cattle = AnimalType.objects.get(name='Cattle')
-        goats = AnimalType.objects.get(name='Goats')
-        sheep = AnimalType.objects.get(name='Sheep')
-        poultry = AnimalType.objects.get(name='Poultry')
-        
-        suitable_mapping = {
-            'Alfalfa Hay': [cattle, goats, sheep],
-            'Timothy Hay': [cattle, goats, sheep],
-            'Grass Hay': [cattle, goats, sheep],
-            'Corn': [cattle, goats, sheep, poultry],
-            'Barley': [cattle, goats, sheep, poultry],
-            'Wheat': [cattle, goats, sheep, poultry],
-            'Cattle Pellets': [cattle],
-            'Goat Pellets': [goats],
-            'Sheep Pellets': [sheep],
-            'Poultry Feed': [poultry],
-            'Fresh Pasture': [cattle, goats, sheep],
-            'Mineral Mix': [cattle, goats, sheep],
-            'Vitamin Supplement': [cattle, goats, sheep, poultry],
-        }
-        
-        for feed_data in feed_types:
-            feed_type, created = FeedType.objects.get_or_create(
-                name=feed_data['name'],
-                defaults={
-                    'category': feed_data['category'],
-                    'protein_percentage': feed_data['protein'],
-                    'energy_mj_per_kg': feed_data['energy'],
-                    'cost_per_kg': feed_data['cost']
-                }
+        rows = [
+            Breed(
+                animal_type=animal_types[animal_name],
+                name=breed_data['name'],
+                average_weight_kg=breed_data['avg_weight'],
+                maturity_months=breed_data['maturity']
             )
-            
-            if created:
-                # Add suitable_for relationships
-                if feed_data['name'] in suitable_mapping:
-                    feed_type.suitable_for.set(suitable_mapping[feed_data['name']])
-                self.stdout.write(f'Created feed type: {feed_type.name}')
+            for animal_name, breeds in BREEDS_DATA.items()
+            for breed_data in breeds
+        ]
+
+        seeded = self.upsert(
+            Breed, rows,
+            unique_fields=['animal_type', 'name'],
+            update_fields=['average_weight_kg', 'maturity_months'],
+        )
+        for breed in seeded:
+            self.log_row(f'Seeded breed: {breed.animal_type.name} - {breed.name}')
+        self.stdout.write(f'Seeded {len(seeded)} breeds')
+
+    def create_feed_types(self):
+        # Get animal types for suitable_for relationships with one query
+        animal_by_name = {a.name: a for a in AnimalType.objects.all()}
+
+        self.upsert(
+            FeedType,
+            [
+                FeedType(
+                    name=f['name'],
+                    category=f['category'],
+                    protein_percentage=f['protein'],
+                    energy_mj_per_kg=f['energy'],
+                    cost_per_kg=f['cost']
+                )
+                for f in FEED_TYPES
+            ],
+            unique_fields=['name'],
+            update_fields=['category', 'protein_percentage', 'energy_mj_per_kg', 'cost_per_kg'],
+        )
+
+        # Re-read the ids so the through rows are correct on every backend,
+        # then add suitable_for links with one INSERT on the through table
+        feed_ids = dict(FeedType.objects.filter(
+            name__in=[f['name'] for f in FEED_TYPES]
+        ).values_list('name', 'id'))
+
+        through = FeedType.suitable_for.through
+        through.objects.bulk_create(
+            [
+                through(feedtype_id=feed_ids[name], animaltype_id=animal_by_name[animal_name].id)
+                for name, animal_names in FEED_SUITABILITY.items()
+                for animal_name in animal_names
+            ],
+            batch_size=self.batch_size,
+            ignore_conflicts=True
+        )
+
+        for name in feed_ids:
+            self.log_row(f'Seeded feed type: {name}')
+        self.stdout.write(f'Seeded {len(feed_ids)} feed types')
 
     def create_feeding_recommendations(self):
-        # Get required objects
-        cattle = AnimalType.objects.get(name='Cattle')
-        goats = AnimalType.objects.get(name='Goats')
-        sheep = AnimalType.objects.get(name='Sheep')
-        poultry = AnimalType.objects.get(name='Poultry')
-        
-        alfalfa = FeedType.objects.get(name='Alfalfa Hay')
-        cattle_pellets = FeedType.objects.get(name='Cattle Pellets')
-        goat_pellets = FeedType.objects.get(name='Goat Pellets')
-        sheep_pellets = FeedType.objects.get(name='Sheep Pellets')
-        poultry_feed = FeedType.objects.get(name='Poultry Feed')
-        pasture = FeedType.objects.get(name='Fresh Pasture')
-        
-        recommendations = [
-            # Cattle recommendations
-            {'animal': cattle, 'feed': alfalfa, 'min_age': 0, 'max_age': 6, 'min_weight': 0, 'max_weight': 150, 'purpose': 'MILK', 'amount': 5.0, 'frequency': 2},
-            {'animal': cattle, 'feed': cattle_pellets, 'min_age': 6, 'max_age': 24, 'min_weight': 150, 'max_weight': 500, 'purpose': 'MEAT', 'amount': 8.0, 'frequency': 2},
-            {'animal': cattle, 'feed': pasture, 'min_age': 3, 'max_age': None, 'min_weight': 100, 'max_weight': None, 'purpose': '', 'amount': 25.0, 'frequency': 1},
-            
-            # Goat recommendations
-            {'animal': goats, 'feed': alfalfa, 'min_age': 0, 'max_age': 12, 'min_weight': 0, 'max_weight': 30, 'purpose': 'MILK', 'amount': 1.5, 'frequency': 2},
-            {'animal': goats, 'feed': goat_pellets, 'min_age': 3, 'max_age': None, 'min_weight': 15, 'max_weight': None, 'purpose': 'MEAT', 'amount': 1.0, 'frequency': 2},
-            {'animal': goats, 'feed': pasture, 'min_age': 2, 'max_age': None, 'min_weight': 10, 'max_weight': None, 'purpose': '', 'amount': 3.0, 'frequency': 1},
-            
-            # Sheep recommendations
-            {'animal': sheep, 'feed': alfalfa, 'min_age': 0, 'max_age': 8, 'min_weight': 0, 'max_weight': 40, 'purpose': 'MEAT', 'amount': 2.0, 'frequency': 2},
-            {'animal': sheep, 'feed': sheep_pellets, 'min_age': 4, 'max_age': None, 'min_weight': 20, 'max_weight': None, 'purpose': 'MEAT', 'amount': 1.2, 'frequency': 2},
-            {'animal': sheep, 'feed': pasture, 'min_age': 2, 'max_age': None, 'min_weight': 15, 'max_weight': None, 'purpose': '', 'amount': 4.0, 'frequency': 1},
-            
-            # Poultry recommendations
-            {'animal': poultry, 'feed': poultry_feed, 'min_age': 0, 'max_age': 2, 'min_weight': 0, 'max_weight': 1, 'purpose': 'EGGS', 'amount': 0.12, 'frequency': 2},
-            {'animal': poultry, 'feed': poultry_feed, 'min_age': 2, 'max_age': None, 'min_weight': 1, 'max_weight': None, 'purpose': 'MEAT', 'amount': 0.15, 'frequency': 3},
-        ]
-        
-        for rec_data in recommendations:
-            recommendation, created = FeedingRecommendation.objects.get_or_create(
-                animal_type=rec_data['animal'],
-                feed_type=rec_data['feed'],
+        # Resolve all FK ids with two SELECTs instead of a .get() per name
+        at_map = {a.name: a.id for a in AnimalType.objects.all()}
+        feed_map = {f.name: f.id for f in FeedType.objects.all()}
+
+        # Integer/string columns only, so the tuples compare cleanly against
+        # the seed data without Decimal coercion
+        existing = set(FeedingRecommendation.objects.values_list(
+            'animal_type_id', 'feed_type_id', 'min_age_months', 'max_age_months', 'purpose'
+        ))
+
+        to_create = []
+        created_labels = []
+        for rec_data in FEEDING_RECOMMENDATIONS:
+            animal_type_id = at_map[rec_data['animal']]
+            feed_type_id = feed_map[rec_data['feed']]
+            key = (animal_type_id, feed_type_id, rec_data['min_age'], rec_data['max_age'], rec_data['purpose'])
+            if key in existing:
+                continue
+            to_create.append(FeedingRecommendation(
+                animal_type_id=animal_type_id,
+                feed_type_id=feed_type_id,
                 min_age_months=rec_data['min_age'],
                 max_age_months=rec_data['max_age'],
                 min_weight_kg=rec_data['min_weight'],
                 max_weight_kg=rec_data['max_weight'],
                 purpose=rec_data['purpose'],
-                defaults={
-                    'daily_amount_kg': rec_data['amount'],
-                    'feeding_frequency': rec_data['frequency']
-                }
-            )
-            
-            if created:
-                self.stdout.write(f'Created feeding recommendation: {rec_data["animal"].name} - {rec_data["feed"].name}')
+                daily_amount_kg=rec_data['amount'],
+                feeding_frequency=rec_data['frequency']
+            ))
+            created_labels.append(f'{rec_data["animal"]} - {rec_data["feed"]}')
+
+        FeedingRecommendation.objects.bulk_create(
+            to_create, batch_size=self.batch_size, ignore_conflicts=True
+        )
+        for label in created_labels:
+            self.log_row(f'Created feeding recommendation: {label}')
+        self.stdout.write(f'Created {len(created_labels)} feeding recommendations')
 
     def create_diseases_and_symptoms(self):
         # Create diseases
-        diseases_data = [
-            {
-                'name': 'Foot and Mouth Disease',
-                'description': 'Highly contagious viral disease affecting cloven-hoofed animals',
-                'animals': ['Cattle', 'Goats', 'Sheep'],
-                'severity': 'CRITICAL',
-                'contagious': True,
-                'vet_required': True,
-                'prevention': 'Vaccination, quarantine new animals, proper sanitation',
-                'treatment': 'Supportive care, isolation, veterinary supervision'
-            },
-            {
-                'name': 'Mastitis',
-                'description': 'Inflammation of the mammary gland, common in dairy animals',
-                'animals': ['Cattle', 'Goats', 'Sheep'],
-                'severity': 'MEDIUM',
-                'contagious': False,
-                'vet_required': True,
-                'prevention': 'Proper milking hygiene, dry cow treatment',
-                'treatment': 'Antibiotics, anti-inflammatory drugs, improved hygiene'
-            },
-            {
-                'name': 'Newcastle Disease',
-                'description': 'Viral disease affecting poultry respiratory and nervous systems',
-                'animals': ['Poultry'],
-                'severity': 'HIGH',
-                'contagious': True,
-                'vet_required': True,
-                'prevention': 'Vaccination, biosecurity measures',
-                'treatment': 'Supportive care, isolation of affected birds'
-            },
-            {
-                'name': 'Parasitic Worms',
-                'description': 'Internal parasites affecting digestive system',
-                'animals': ['Cattle', 'Goats', 'Sheep'],
-                'severity': 'MEDIUM',
-                'contagious': False,
-                'vet_required': False,
-                'prevention': 'Regular deworming, pasture rotation, fecal testing',
-                'treatment': 'Anthelmintic medications, improved nutrition'
-            },
-            {
-                'name': 'Coccidiosis',
-                'description': 'Parasitic disease affecting the intestinal tract',
-                'animals': ['Poultry', 'Goats', 'Sheep'],
-                'severity': 'MEDIUM',
-                'contagious': True,
-                'vet_required': False,
-                'prevention': 'Clean water, dry bedding, proper sanitation',
-                'treatment': 'Anticoccidial drugs, supportive care'
-            }
-        ]
-        
-        created_diseases = {}
-        for disease_data in diseases_data:
-            disease, created = Disease.objects.get_or_create(
-                name=disease_data['name'],
-                defaults={
-                    'description': disease_data['description'],
-                    'severity': disease_data['severity'],
-                    'is_contagious': disease_data['contagious'],
-                    'vet_required': disease_data['vet_required'],
-                    'prevention_measures': disease_data['prevention'],
-                    'treatment_advice': disease_data['treatment']
-                }
+        at_map = {a.name: a.id for a in AnimalType.objects.all()}
+        existing_diseases = set(Disease.objects.filter(
+            name__in=[d['name'] for d in DISEASES_DATA]
+        ).values_list('name', flat=True))
+
+        created = Disease.objects.bulk_create([
+            Disease(
+                name=d['name'],
+                description=d['description'],
+                severity=d['severity'],
+                is_contagious=d['contagious'],
+                vet_required=d['vet_required'],
+                prevention_measures=d['prevention'],
+                treatment_advice=d['treatment']
             )
-            
-            if created:
-                # Add affected animals
-                animal_types = AnimalType.objects.filter(name__in=disease_data['animals'])
-                disease.affected_animals.set(animal_types)
-                created_diseases[disease_data['name']] = disease
-                self.stdout.write(f'Created disease: {disease.name}')
+            for d in DISEASES_DATA if d['name'] not in existing_diseases
+        ], batch_size=self.batch_size)
+
+        # One INSERT on the through table covers every affected_animals link
+        affected_by_name = {d['name']: d['animals'] for d in DISEASES_DATA}
+        affected_through = Disease.affected_animals.through
+        affected_through.objects.bulk_create(
+            [
+                affected_through(disease_id=disease.id, animaltype_id=at_map[animal_name])
+                for disease in created
+                for animal_name in affected_by_name[disease.name]
+            ],
+            batch_size=self.batch_size,
+            ignore_conflicts=True
+        )
+        for disease in created:
+            self.log_row(f'Created disease: {disease.name}')
+        self.stdout.write(f'Created {len(created)} diseases')
         
         # Create symptoms
-        symptoms_data = [
-            {'name': 'Fever', 'diseases': ['Foot and Mouth Disease', 'Newcastle Disease']},
-            {'name': 'Loss of Appetite', 'diseases': ['Foot and Mouth Disease', 'Newcastle Disease', 'Parasitic Worms', 'Coccidiosis']},
-            {'name': 'Lameness', 'diseases': ['Foot and Mouth Disease']},
-            {'name': 'Blisters on mouth/feet', 'diseases': ['Foot and Mouth Disease']},
-            {'name': 'Swollen udder', 'diseases': ['Mastitis']},
-            {'name': 'Abnormal milk', 'diseases': ['Mastitis']},
-            {'name': 'Respiratory distress', 'diseases': ['Newcastle Disease']},
-            {'name': 'Diarrhea', 'diseases': ['Parasitic Worms', 'Coccidiosis']},
-            {'name': 'Weight loss', 'diseases': ['Parasitic Worms', 'Coccidiosis']},
-            {'name': 'Pale mucous membranes', 'diseases': ['Parasitic Worms']},
-            {'name': 'Blood in droppings', 'diseases': ['Coccidiosis']},
-            {'name': 'Sudden death', 'diseases': ['Newcastle Disease', 'Coccidiosis']},
-        ]
-        
-        for symptom_data in symptoms_data:
-            symptom, created = Symptom.objects.get_or_create(
-                name=symptom_data['name']
-            )
-            
-            if created:
-                # Link to diseases
-                related_diseases = Disease.objects.filter(name__in=symptom_data['diseases'])
-                symptom.diseases.set(related_diseases)
-                self.stdout.write(f'Created symptom: {symptom.name}')
+        disease_map = {d.name: d.id for d in Disease.objects.all()}
+        existing_symptoms = set(Symptom.objects.filter(
+            name__in=[s['name'] for s in SYMPTOMS_DATA]
+        ).values_list('name', flat=True))
+
+        created = Symptom.objects.bulk_create([
+            Symptom(name=s['name'])
+            for s in SYMPTOMS_DATA if s['name'] not in existing_symptoms
+        ], batch_size=self.batch_size)
+
+        diseases_by_symptom = {s['name']: s['diseases'] for s in SYMPTOMS_DATA}
+        symptom_through = Symptom.diseases.through
+        symptom_through.objects.bulk_create(
+            [
+                symptom_through(symptom_id=symptom.id, disease_id=disease_map[disease_name])
+                for symptom in created
+                for disease_name in diseases_by_symptom[symptom.name]
+            ],
+            batch_size=self.batch_size,
+            ignore_conflicts=True
+        )
+        for symptom in created:
+            self.log_row(f'Created symptom: {symptom.name}')
+        self.stdout.write(f'Created {len(created)} symptoms')
 
     def create_market_prices(self):
         # Create sample market prices for the last 30 days
         base_date = date.today() - timedelta(days=30)
-        
-        animal_types = AnimalType.objects.all()
-        locations = ['Local Market', 'Regional Market', 'Premium Market']
-        
+
+        # Seeded instance keeps the sample prices reproducible between runs
+        rng = random.Random(42)
+
+        animal_types = list(AnimalType.objects.all())
+        location_multipliers = {
+            'Local Market': 1.0,
+            'Regional Market': 1.05,
+            'Premium Market': 1.15,
+        }
+
         base_prices = {
             'Cattle': 4.50,
             'Goats': 6.00,
             'Sheep': 5.25,
             'Poultry': 8.50
         }
-        
+
+        # One SELECT for the already-seeded cells, one INSERT for the rest,
+        # instead of a get_or_create round trip per (animal, day, location)
+        existing = set(MarketPrice.objects.values_list(
+            'animal_type_id', 'location', 'date_recorded'
+        ))
+
+        # Draw every variation up front in one pass and index into the list
+        # inside the loops; the same shape a vectorized RNG would produce,
+        # without a numpy dependency for 72 scalars
+        uniform = rng.uniform
+        days = range(0, 30, 5)  # Every 5 days
+        variations = [
+            uniform(0.8, 1.2)
+            for _ in range(len(animal_types) * len(days) * len(location_multipliers))
+        ]
+
+        to_create = []
+        cell = 0
         for animal_type in animal_types:
             base_price = base_prices.get(animal_type.name, 5.00)
-            
-            for i in range(0, 30, 5):  # Every 5 days
+
+            for i in days:
                 price_date = base_date + timedelta(days=i)
-                
-                for location in locations:
+
+                for location, location_multiplier in location_multipliers.items():
+                    variation = variations[cell]
+                    cell += 1
+                    if (animal_type.id, location, price_date) in existing:
+                        continue
+
                     # Add some price variation
-                    import random
-                    price_variation = random.uniform(0.8, 1.2)
-                    location_multiplier = 1.0
-                    
-                    if location == 'Premium Market':
-                        location_multiplier = 1.15
-                    elif location == 'Regional Market':
-                        location_multiplier = 1.05
-                    
-                    price = round(base_price * price_variation * location_multiplier, 2)
-                    
-                    market_price, created = MarketPrice.objects.get_or_create(
+                    price = round(base_price * variation * location_multiplier, 2)
+
+                    to_create.append(MarketPrice(
                         animal_type=animal_type,
                         location=location,
                         date_recorded=price_date,
-                        defaults={
-                            'price_per_kg': price,
-                            'quality_grade': 'GOOD',
-                            'source': 'Sample Data'
-                        }
-                    )
-                    
-                    if created:
-                        self.stdout.write(f'Created market price: {animal_type.name} - {location} - ${price}/kg')
+                        price_per_kg=price,
+                        quality_grade='GOOD',
+                        source='Sample Data'
+                    ))
+
+        created = MarketPrice.objects.bulk_create(
+            to_create, batch_size=self.batch_size, ignore_conflicts=True
+        )
+        for market_price in created:
+            self.log_row(
+                f'Created market price: {market_price.animal_type.name} - '
+                f'{market_price.location} - ${market_price.price_per_kg}/kg'
+            )
+        self.stdout.write(f'Created {len(created)} market prices')
 
     def create_sample_livestock(self):
-        # Check if there are any users in the system
-        users = User.objects.filter(is_superuser=False)
-        if not users.exists():
+        # Only id and username are used, so project just those two columns
+        # instead of materializing full User instances
+        users = list(User.objects.filter(is_superuser=False).values_list('id', 'username'))
+        if not users:
             self.stdout.write(self.style.WARNING('No regular users found. Creating sample livestock for all users including superusers.'))
-            users = User.objects.all()
-        
-        if not users.exists():
+            users = list(User.objects.values_list('id', 'username'))
+
+        if not users:
             self.stdout.write(self.style.WARNING('No users found in the system. Skipping livestock creation.'))
             return
+
+        username_by_id = dict(users)
         
-        # Get animal types and breeds
-        cattle = AnimalType.objects.get(name='Cattle')
-        goats = AnimalType.objects.get(name='Goats')
-        sheep = AnimalType.objects.get(name='Sheep')
-        poultry = AnimalType.objects.get(name='Poultry')
-        
-        holstein = Breed.objects.get(name='Holstein', animal_type=cattle)
-        angus = Breed.objects.get(name='Angus', animal_type=cattle)
-        boer = Breed.objects.get(name='Boer', animal_type=goats)
-        nubian = Breed.objects.get(name='Nubian', animal_type=goats)
-        dorper = Breed.objects.get(name='Dorper', animal_type=sheep)
-        rhode_island = Breed.objects.get(name='Rhode Island Red', animal_type=poultry)
-        
-        # Sample livestock data for each user
-        sample_livestock = [
-            # Cattle
-            {
-                'animal_type': cattle, 'breed': holstein, 'tag_number': 'C001', 
-                'name': 'Bessie', 'gender': 'F', 'purpose': 'MILK', 
-                'weight': 450, 'age_days': 720, 'purchase_price': 1200
-            },
-            {
-                'animal_type': cattle, 'breed': angus, 'tag_number': 'C002', 
-                'name': 'Thunder', 'gender': 'M', 'purpose': 'MEAT', 
-                'weight': 380, 'age_days': 540, 'purchase_price': 900
-            },
-            {
-                'animal_type': cattle, 'breed': holstein, 'tag_number': 'C003', 
-                'name': 'Daisy', 'gender': 'F', 'purpose': 'MILK', 
-                'weight': 420, 'age_days': 650, 'purchase_price': 1100
-            },
-            
-            # Goats
-            {
-                'animal_type': goats, 'breed': boer, 'tag_number': 'G001', 
-                'name': 'Billy', 'gender': 'M', 'purpose': 'MEAT', 
-                'weight': 45, 'age_days': 365, 'purchase_price': 150
-            },
-            {
-                'animal_type': goats, 'breed': nubian, 'tag_number': 'G002', 
-                'name': 'Nanny', 'gender': 'F', 'purpose': 'MILK', 
-                'weight': 55, 'age_days': 450, 'purchase_price': 200
-            },
-            {
-                'animal_type': goats, 'breed': boer, 'tag_number': 'G003', 
-                'name': 'Kid', 'gender': 'F', 'purpose': 'BREEDING', 
-                'weight': 35, 'age_days': 240, 'purchase_price': 180
-            },
-            
-            # Sheep
-            {
-                'animal_type': sheep, 'breed': dorper, 'tag_number': 'S001', 
-                'name': 'Woolly', 'gender': 'F', 'purpose': 'MEAT', 
-                'weight': 60, 'age_days': 300, 'purchase_price': 120
-            },
-            {
-                'animal_type': sheep, 'breed': dorper, 'tag_number': 'S002', 
-                'name': 'Ram', 'gender': 'M', 'purpose': 'BREEDING', 
-                'weight': 75, 'age_days': 600, 'purchase_price': 200
-            },
-            
-            # Poultry
-            {
-                'animal_type': poultry, 'breed': rhode_island, 'tag_number': 'P001', 
-                'name': 'Henrietta', 'gender': 'F', 'purpose': 'EGGS', 
-                'weight': 2.2, 'age_days': 120, 'purchase_price': 15
-            },
-            {
-                'animal_type': poultry, 'breed': rhode_island, 'tag_number': 'P002', 
-                'name': 'Rooster', 'gender': 'M', 'purpose': 'BREEDING', 
-                'weight': 3.0, 'age_days': 180, 'purchase_price': 25
-            },
-        ]
-        
-        for user in users:
-            # Create farmer profile if it doesn't exist
-            farmer_profile, profile_created = FarmerProfile.objects.get_or_create(
-                user=user,
-                defaults={
-                    'location': 'Sample Farm Location',
-                    'farm_size_acres': 50.0,
-                    'experience_years': 5
-                }
-            )
-            
-            if profile_created:
-                self.stdout.write(f'Created farmer profile for: {user.username}')
-            
-            # Create livestock for each user (modify tag numbers to be unique per user)
-            for i, livestock_data in enumerate(sample_livestock):
+        # Get animal types and breeds with one query each
+        animal_by_name = {a.name: a for a in AnimalType.objects.all()}
+        breed_by_key = {
+            (b.animal_type_id, b.name): b
+            for b in Breed.objects.select_related('animal_type')
+        }
+
+        # Create any missing farmer profiles in one SELECT + one INSERT
+        existing_profile_user_ids = set(
+            FarmerProfile.objects.filter(user_id__in=username_by_id).values_list('user_id', flat=True)
+        )
+        new_profiles = FarmerProfile.objects.bulk_create(
+            [
+                FarmerProfile(
+                    user_id=user_id,
+                    location='Sample Farm Location',
+                    farm_size_acres=50.0,
+                    experience_years=5
+                )
+                for user_id, _ in users if user_id not in existing_profile_user_ids
+            ],
+            batch_size=self.batch_size,
+            ignore_conflicts=True
+        )
+        for profile in new_profiles:
+            self.log_row(f'Created farmer profile for: {username_by_id[profile.user_id]}')
+
+        # Existing (farmer, tag) pairs once, then one INSERT for every
+        # missing row across all users
+        existing = set(Livestock.objects.values_list('farmer_id', 'tag_number'))
+
+        today = date.today()
+        to_create = []
+        for user_id, username in users:
+            for livestock_data in SAMPLE_LIVESTOCK:
                 # Make tag number unique per user
-                unique_tag = f"{user.id}_{livestock_data['tag_number']}"
-                
+                unique_tag = f"{user_id}_{livestock_data['tag_number']}"
+                if (user_id, unique_tag) in existing:
+                    continue
+
                 # Calculate birth date
-                birth_date = date.today() - timedelta(days=livestock_data['age_days'])
+                birth_date = today - timedelta(days=livestock_data['age_days'])
                 purchase_date = birth_date + timedelta(days=30)  # Assume purchased 30 days after birth
-                
-                livestock, created = Livestock.objects.get_or_create(
-                    farmer=user,
+
+                animal_type = animal_by_name[livestock_data['animal']]
+                to_create.append(Livestock(
+                    farmer_id=user_id,
+                    animal_type=animal_type,
+                    breed=breed_by_key[(animal_type.id, livestock_data['breed'])],
                     tag_number=unique_tag,
-                    defaults={
-                        'animal_type': livestock_data['animal_type'],
-                        'breed': livestock_data['breed'],
-                        'name': livestock_data['name'],
-                        'gender': livestock_data['gender'],
-                        'date_of_birth': birth_date,
-                        'current_weight_kg': livestock_data['weight'],
-                        'purpose': livestock_data['purpose'],
-                        'status': 'HEALTHY',
-                        'purchase_date': purchase_date,
-                        'purchase_price': livestock_data['purchase_price'],
-                        'notes': f'Sample livestock created for testing - {livestock_data["name"]}'
-                    }
-                )
-                
-                if created:
-                    self.stdout.write(f'Created livestock for {user.username}: {livestock.name} ({livestock.tag_number})')
-                
-        self.stdout.write(self.style.SUCCESS(f'Sample livestock creation completed for {users.count()} users!'))
+                    name=livestock_data['name'],
+                    gender=livestock_data['gender'],
+                    date_of_birth=birth_date,
+                    current_weight_kg=livestock_data['weight'],
+                    purpose=livestock_data['purpose'],
+                    status='HEALTHY',
+                    purchase_date=purchase_date,
+                    purchase_price=livestock_data['purchase_price'],
+                    notes=f'Sample livestock created for testing - {livestock_data["name"]}',
+                    is_sample=True
+                ))
+
+        created = Livestock.objects.bulk_create(
+            to_create, batch_size=self.batch_size, ignore_conflicts=True
+        )
+        for livestock in created:
+            self.log_row(f'Created livestock for {username_by_id[livestock.farmer_id]}: {livestock.name} ({livestock.tag_number})')
+
+        self.stdout.write(self.style.SUCCESS(f'Sample livestock creation completed for {len(users)} users!'))
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-08-29 21:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_costrecord_pricealert_salerecord'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='marketprice',
+            index=models.Index(fields=['animal_type', '-date_recorded'], name='core_market_animal__e78cb8_idx'),
+        ),
+    ]
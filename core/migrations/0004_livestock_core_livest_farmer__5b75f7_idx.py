@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-08-29 21:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_marketprice_core_market_animal__e78cb8_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='livestock',
+            index=models.Index(fields=['farmer', '-created_at'], name='core_livest_farmer__5b75f7_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-08-29 21:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_livestock_core_livest_farmer__5b75f7_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='marketprice',
+            index=models.Index(fields=['-date_recorded'], name='core_market_date_re_6fd124_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-08-29 21:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_marketprice_core_market_date_re_6fd124_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='livestock',
+            name='is_sample',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+    ]
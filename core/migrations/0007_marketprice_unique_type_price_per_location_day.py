@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-08-29 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_livestock_is_sample'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='marketprice',
+            constraint=models.UniqueConstraint(condition=models.Q(('breed__isnull', True)), fields=('animal_type', 'location', 'date_recorded'), name='unique_type_price_per_location_day'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-08-29 21:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_marketprice_unique_type_price_per_location_day'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='costrecord',
+            index=models.Index(fields=['livestock', 'category'], name='core_costre_livesto_37f577_idx'),
+        ),
+    ]
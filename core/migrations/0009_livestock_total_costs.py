@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-08-29 21:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_costrecord_core_costre_livesto_37f577_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='livestock',
+            name='total_costs',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+        ),
+    ]
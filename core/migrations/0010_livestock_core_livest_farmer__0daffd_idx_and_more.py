@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-08-29 21:53
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_livestock_total_costs'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='livestock',
+            index=models.Index(fields=['farmer', 'status'], name='core_livest_farmer__0daffd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='marketprice',
+            index=models.Index(fields=['animal_type', 'quality_grade', '-date_recorded'], name='core_market_animal__f18147_idx'),
+        ),
+    ]
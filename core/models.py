@@ -59,6 +59,25 @@ class Breed(models.Model):
         verbose_name_plural = "Breeds"
 
 
+class LivestockQuerySet(models.QuerySet):
+    def with_age_months(self):
+        """
+        Annotate each row with its age in months, computed in SQL with the
+        same year/month arithmetic as the age_months property. Lets bulk
+        sweeps read ages without per-row date math and lets callers filter
+        on age database-side.
+        """
+        from django.db.models.functions import ExtractMonth, ExtractYear, Now
+
+        return self.annotate(
+            db_age_months=models.ExpressionWrapper(
+                (ExtractYear(Now()) - ExtractYear('date_of_birth')) * 12
+                + ExtractMonth(Now()) - ExtractMonth('date_of_birth'),
+                output_field=models.IntegerField(),
+            )
+        )
+
+
 class Livestock(models.Model):
     """
     Individual livestock animals owned by farmers
@@ -97,16 +116,29 @@ class Livestock(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='HEALTHY')
     purchase_date = models.DateField(blank=True, null=True)
     purchase_price = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
+    # Denormalized running sum of this animal's CostRecord amounts,
+    # maintained by the CostRecord signals; lets total-only readers skip
+    # the cost aggregation entirely
+    total_costs = models.DecimalField(max_digits=12, decimal_places=2, default=0)
     notes = models.TextField(blank=True)
+    # Marks rows created by the seeding commands so they can be cleared
+    # with an indexed filter instead of a LIKE scan over notes
+    is_sample = models.BooleanField(default=False, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    objects = LivestockQuerySet.as_manager()
+
     def __str__(self):
         display_name = self.name if self.name else f"Tag #{self.tag_number}"
         return f"{display_name} ({self.animal_type.name})"
-    
+
     @property
     def age_months(self):
+        # Rows loaded through with_age_months() carry the value already
+        db_age_months = getattr(self, 'db_age_months', None)
+        if db_age_months is not None:
+            return db_age_months
         if self.date_of_birth:
             from datetime import date
             today = date.today()
@@ -116,6 +148,12 @@ class Livestock(models.Model):
     class Meta:
         verbose_name = "Livestock"
         verbose_name_plural = "Livestock"
+        indexes = [
+            models.Index(fields=['farmer', '-created_at']),
+            # Serves the per-farmer herd scans filtered by status, e.g. the
+            # selling-recommendation sweep over HEALTHY animals
+            models.Index(fields=['farmer', 'status']),
+        ]
 
 
 class FeedType(models.Model):
@@ -275,6 +313,23 @@ class MarketPrice(models.Model):
         verbose_name = "Market Price"
         verbose_name_plural = "Market Prices"
         ordering = ['-date_recorded']
+        indexes = [
+            models.Index(fields=['animal_type', '-date_recorded']),
+            # Serves the date-window scans that do not filter by animal type
+            models.Index(fields=['-date_recorded']),
+            # Covers the price-analysis window: filter on type and grade,
+            # newest first
+            models.Index(fields=['animal_type', 'quality_grade', '-date_recorded']),
+        ]
+        constraints = [
+            # One type-level price per market and day; breed-specific rows
+            # (breed set) stay unconstrained
+            models.UniqueConstraint(
+                fields=['animal_type', 'location', 'date_recorded'],
+                condition=models.Q(breed__isnull=True),
+                name='unique_type_price_per_location_day',
+            ),
+        ]
 
 
 class PriceAlert(models.Model):
@@ -366,3 +421,7 @@ class CostRecord(models.Model):
         verbose_name = "Cost Record"
         verbose_name_plural = "Cost Records"
         ordering = ['-date_incurred']
+        indexes = [
+            # Covers the grouped cost-total aggregation in the pricing service
+            models.Index(fields=['livestock', 'category']),
+        ]
@@ -1,8 +1,39 @@
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 from datetime import date, timedelta
+
+from django.db.models import Sum
+
 from .models import AnimalType, MarketPrice
 
+# Static lookup tables shared by every analysis call, built once at import
+# time instead of per invocation
+
+# Base estimated prices by animal type (these would come from external APIs
+# in production); also the fallback when no recent market rows exist
+_BASE_PRICES = {
+    'Cattle': 8.50,
+    'Goats': 12.00,
+    'Sheep': 10.00,
+    'Poultry': 4.50,
+    'Pigs': 6.00,
+}
+_DEFAULT_BASE_PRICE = 7.00
+
+_QUALITY_ADJUSTMENTS = {
+    'PREMIUM': 1.3,
+    'GOOD': 1.1,
+    'AVERAGE': 1.0,
+    'POOR': 0.8,
+}
+
+# Typical market-ready age in months per animal type
+_OPTIMAL_AGES = {
+    'Cattle': 24,
+    'Goats': 12,
+    'Sheep': 12,
+    'Poultry': 3,
+}
 
 
 @dataclass
@@ -76,105 +107,120 @@ class PricingAnalysisService:
         # Filter by quality grade
         recent_prices = recent_prices.filter(quality_grade=price_input.quality_grade)
         
-        if not recent_prices.exists():
+        # Materialize the window once as plain column dicts; every statistic
+        # below reads the same rows without model instance overhead, and
+        # converting Decimal to float a single time keeps the trend
+        # arithmetic in cheap machine floats. Nothing reads past the 30
+        # newest rows, so LIMIT in SQL rather than in Python
+        price_records = list(recent_prices.values(
+            'date_recorded', 'price_per_kg', 'location', 'quality_grade'
+        )[:30])
+        if not price_records:
             return self._generate_estimated_price(animal_type, price_input)
-        
-        # Calculate current average price
-        latest_prices = recent_prices[:5]  # Last 5 price records
-        current_price = sum(float(p.price_per_kg) for p in latest_prices) / len(latest_prices)
-        
+
+        price_floats = [float(row['price_per_kg']) for row in price_records]
+
+        # Calculate current average price from the last 5 price records
+        latest_prices = price_floats[:5]
+        current_price = sum(latest_prices) / len(latest_prices)
+
         # Calculate trend
-        trend_data = self._calculate_price_trend(recent_prices)
-        
+        trend_data = self._calculate_price_trend(price_floats)
+
         # Generate recommendation
         recommendation = self._generate_market_recommendation(trend_data, current_price, animal_type)
-        
+
         # Historical data for charts
-        historical_data = self._format_historical_data(recent_prices[:30])
-        
+        historical_data = self._format_historical_data(price_records)
+
         return PriceAnalysisResult(
             current_price_per_kg=round(current_price, 2),
             price_trend=trend_data['trend'],
             trend_percentage=trend_data['percentage'],
             market_recommendation=recommendation,
-            confidence_level=self._calculate_confidence_level(recent_prices),
+            confidence_level=self._calculate_confidence_level(len(price_records)),
             historical_data=historical_data,
             location=price_input.location,
             date_analyzed=date.today().strftime('%Y-%m-%d')
         )
     
-    def analyze_livestock_profitability(self, livestock_id: int) -> ProfitabilityResult:
+    def analyze_livestock_profitability(self, livestock) -> ProfitabilityResult:
         """
         Analyze profitability of a specific livestock animal
-        
+
         Args:
-            livestock_id: ID of the livestock to analyze
-            
+            livestock: already-fetched Livestock instance to analyze
+
         Returns:
             ProfitabilityResult object with profitability analysis
         """
-        from .models import Livestock, CostRecord, MarketPrice
-        
-        try:
-            livestock = Livestock.objects.get(id=livestock_id)
-        except Livestock.DoesNotExist:
-            return None
-        
         # Calculate current market value
         current_market_value = self._calculate_current_market_value(livestock)
-        
-        # Calculate total investment (purchase price + costs)
-        total_investment = self._calculate_total_investment(livestock)
-        
-        # Calculate estimated profit
-        estimated_profit = current_market_value - total_investment
-        profit_margin = (estimated_profit / total_investment * 100) if total_investment > 0 else 0
-        
-        # Calculate break-even price
-        break_even_price = total_investment / float(livestock.current_weight_kg or 1)
-        
-        # Generate recommendation
-        recommendation = self._generate_profitability_recommendation(
-            profit_margin, estimated_profit, livestock
-        )
-        
-        # Cost breakdown
-        cost_breakdown = self._get_cost_breakdown(livestock)
-        
-        return ProfitabilityResult(
-            livestock_id=livestock_id,
-            current_market_value=round(current_market_value, 2),
-            total_investment=round(total_investment, 2),
-            estimated_profit=round(estimated_profit, 2),
-            profit_margin_percentage=round(profit_margin, 2),
-            break_even_price=round(break_even_price, 2),
-            recommendation=recommendation,
-            cost_breakdown=cost_breakdown
-        )
-    
+
+        # One aggregated cost query feeds both the breakdown and the
+        # investment total
+        cost_breakdown = self._bulk_cost_breakdown([livestock])[livestock.id]
+
+        return self._build_profitability_result(livestock, current_market_value, cost_breakdown)
+
     def get_selling_recommendations(self, farmer_id: int) -> List[Dict]:
         """Get selling recommendations for all farmer's livestock"""
-        from .models import Livestock
-        
-        livestock_list = Livestock.objects.filter(
+        from .models import Livestock, MarketPrice
+
+        # with_age_months() computes each animal's age in SQL, so the
+        # selling-time estimates below skip per-row date arithmetic.
+        # farmer and breed__animal_type are joined too because the
+        # recommendation serializer renders both per animal
+        livestock_list = list(Livestock.objects.filter(
             farmer_id=farmer_id,
             status='HEALTHY'
-        )
-        
+        ).select_related('animal_type', 'farmer', 'breed__animal_type').with_age_months())
+
+        if not livestock_list:
+            return []
+
+        # Load every recent price the herd could need in one query and group
+        # in memory, instead of a MarketPrice round-trip per livestock
+        animal_type_ids = {livestock.animal_type_id for livestock in livestock_list}
+        recent_prices = MarketPrice.objects.filter(
+            animal_type_id__in=animal_type_ids,
+            date_recorded__gte=date.today() - timedelta(days=30)
+        ).order_by('-date_recorded')
+
+        prices_by_type = {}
+        prices_by_breed = {}
+        for price in recent_prices:
+            prices_by_type.setdefault(price.animal_type_id, []).append(price)
+            if price.breed_id:
+                prices_by_breed.setdefault((price.animal_type_id, price.breed_id), []).append(price)
+
+        # Likewise one aggregated query for every animal's cost totals
+        cost_breakdowns = self._bulk_cost_breakdown(livestock_list)
+
         recommendations = []
         for livestock in livestock_list:
-            profitability = self.analyze_livestock_profitability(livestock.id)
-            if profitability:
-                recommendations.append({
-                    'livestock': livestock,
-                    'profitability': profitability,
-                    'action_priority': self._calculate_action_priority(profitability),
-                    'optimal_selling_time': self._estimate_optimal_selling_time(livestock)
-                })
-        
+            # Prefer breed-specific prices, falling back to the animal type
+            prices = None
+            if livestock.breed_id:
+                prices = prices_by_breed.get((livestock.animal_type_id, livestock.breed_id))
+            if not prices:
+                prices = prices_by_type.get(livestock.animal_type_id, [])
+
+            current_market_value = self._market_value_from_prices(livestock, prices)
+            profitability = self._build_profitability_result(
+                livestock, current_market_value, cost_breakdowns[livestock.id]
+            )
+
+            recommendations.append({
+                'livestock': livestock,
+                'profitability': profitability,
+                'action_priority': self._calculate_action_priority(profitability),
+                'optimal_selling_time': self._estimate_optimal_selling_time(livestock)
+            })
+
         # Sort by action priority and profit potential
         recommendations.sort(key=lambda x: (-x['action_priority'], -x['profitability'].estimated_profit))
-        
+
         return recommendations
     
     def _create_empty_price_result(self, location: str) -> PriceAnalysisResult:
@@ -192,26 +238,10 @@ class PricingAnalysisService:
     
     def _generate_estimated_price(self, animal_type, price_input: PriceAnalysisInput) -> PriceAnalysisResult:
         """Generate estimated prices when no recent data available"""
-        # Base estimated prices by animal type (these would come from external APIs in production)
-        base_prices = {
-            'Cattle': 8.50,
-            'Goats': 12.00,
-            'Sheep': 10.00,
-            'Poultry': 4.50,
-            'Pigs': 6.00
-        }
-        
-        estimated_price = base_prices.get(animal_type.name, 7.00)
-        
+        estimated_price = _BASE_PRICES.get(animal_type.name, _DEFAULT_BASE_PRICE)
+
         # Adjust for quality grade
-        quality_adjustments = {
-            'PREMIUM': 1.3,
-            'GOOD': 1.1,
-            'AVERAGE': 1.0,
-            'POOR': 0.8
-        }
-        
-        adjusted_price = estimated_price * quality_adjustments.get(price_input.quality_grade, 1.0)
+        adjusted_price = estimated_price * _QUALITY_ADJUSTMENTS.get(price_input.quality_grade, 1.0)
         
         return PriceAnalysisResult(
             current_price_per_kg=round(adjusted_price, 2),
@@ -224,15 +254,15 @@ class PricingAnalysisService:
             date_analyzed=date.today().strftime('%Y-%m-%d')
         )
     
-    def _calculate_price_trend(self, recent_prices) -> Dict:
-        """Calculate price trend from recent data"""
-        if len(recent_prices) < 2:
+    def _calculate_price_trend(self, prices: List[float]) -> Dict:
+        """Calculate price trend from recent prices (floats, newest first)"""
+        if len(prices) < 2:
             return {'trend': 'STABLE', 'percentage': 0.0}
-        
+
         # Compare recent average with older average
-        recent_avg = sum(float(p.price_per_kg) for p in recent_prices[:5]) / min(5, len(recent_prices))
-        older_avg = sum(float(p.price_per_kg) for p in recent_prices[5:15]) / min(10, len(recent_prices[5:15])) if len(recent_prices) > 5 else recent_avg
-        
+        recent_avg = sum(prices[:5]) / min(5, len(prices))
+        older_avg = sum(prices[5:15]) / len(prices[5:15]) if len(prices) > 5 else recent_avg
+
         if older_avg == 0:
             return {'trend': 'STABLE', 'percentage': 0.0}
         
@@ -263,10 +293,8 @@ class PricingAnalysisService:
         else:
             return f"Stable market conditions. Normal selling/buying activities recommended."
     
-    def _calculate_confidence_level(self, recent_prices) -> str:
+    def _calculate_confidence_level(self, price_count: int) -> str:
         """Calculate confidence level based on data availability"""
-        price_count = len(recent_prices)
-        
         if price_count >= 15:
             return 'HIGH'
         elif price_count >= 5:
@@ -274,57 +302,86 @@ class PricingAnalysisService:
         else:
             return 'LOW'
     
-    def _format_historical_data(self, price_records) -> List[Dict]:
-        """Format historical data for frontend charts"""
+    def _format_historical_data(self, price_rows) -> List[Dict]:
+        """Format historical column rows for frontend charts"""
         return [
             {
-                'date': record.date_recorded.strftime('%Y-%m-%d'),
-                'price': float(record.price_per_kg),
-                'location': record.location,
-                'quality': record.quality_grade
+                'date': row['date_recorded'].strftime('%Y-%m-%d'),
+                'price': float(row['price_per_kg']),
+                'location': row['location'],
+                'quality': row['quality_grade']
             }
-            for record in price_records
+            for row in price_rows
         ]
     
     def _calculate_current_market_value(self, livestock) -> float:
         """Calculate current market value of livestock"""
         from .models import MarketPrice
-        
-        # Get recent market prices for this animal type and location
+
+        # Only the price column crosses the wire, and the five newest rows
+        # are sliced in SQL instead of materializing model instances
         recent_prices = MarketPrice.objects.filter(
-            animal_type=livestock.animal_type,
+            animal_type_id=livestock.animal_type_id,
             date_recorded__gte=date.today() - timedelta(days=30)
         ).order_by('-date_recorded')
-        
-        if livestock.breed:
-            breed_prices = recent_prices.filter(breed=livestock.breed)
-            if breed_prices.exists():
-                recent_prices = breed_prices
-        
-        if recent_prices.exists():
-            # Use average of recent prices
-            avg_price_per_kg = sum(float(p.price_per_kg) for p in recent_prices[:5]) / min(5, len(recent_prices))
+
+        prices = []
+        if livestock.breed_id:
+            prices = list(recent_prices.filter(
+                breed_id=livestock.breed_id
+            ).values_list('price_per_kg', flat=True)[:5])
+        if not prices:
+            prices = list(recent_prices.values_list('price_per_kg', flat=True)[:5])
+
+        if prices:
+            avg_price_per_kg = sum(map(float, prices)) / len(prices)
         else:
-            # Use estimated prices
-            base_prices = {'Cattle': 8.50, 'Goats': 12.00, 'Sheep': 10.00, 'Poultry': 4.50}
-            avg_price_per_kg = base_prices.get(livestock.animal_type.name, 7.00)
-        
+            avg_price_per_kg = self._estimated_price_per_kg(livestock)
+
         current_weight = float(livestock.current_weight_kg or 0)
         return avg_price_per_kg * current_weight
-    
-    def _calculate_total_investment(self, livestock) -> float:
-        """Calculate total investment in livestock"""
-        from .models import CostRecord
-        
-        # Initial purchase price
-        total_investment = float(livestock.purchase_price or 0)
-        
-        # Add all costs associated with this livestock
-        costs = CostRecord.objects.filter(livestock=livestock)
-        total_costs = sum(float(cost.amount) for cost in costs)
-        
-        return total_investment + total_costs
-    
+
+    def _market_value_from_prices(self, livestock, prices) -> float:
+        """Market value from already-loaded recent prices (newest first)"""
+        if prices:
+            # Use average of the latest price records
+            sample = prices[:5]
+            avg_price_per_kg = sum(float(p.price_per_kg) for p in sample) / len(sample)
+        else:
+            avg_price_per_kg = self._estimated_price_per_kg(livestock)
+
+        current_weight = float(livestock.current_weight_kg or 0)
+        return avg_price_per_kg * current_weight
+
+    def _estimated_price_per_kg(self, livestock) -> float:
+        """Fallback per-kg estimate when no recent prices exist"""
+        return _BASE_PRICES.get(livestock.animal_type.name, _DEFAULT_BASE_PRICE)
+
+    def _build_profitability_result(self, livestock, current_market_value: float,
+                                    cost_breakdown: Dict) -> ProfitabilityResult:
+        """Assemble a ProfitabilityResult from precomputed value and costs"""
+        # Total investment is the purchase price plus every cost category
+        total_investment = sum(cost_breakdown.values())
+
+        estimated_profit = current_market_value - total_investment
+        profit_margin = (estimated_profit / total_investment * 100) if total_investment > 0 else 0
+        break_even_price = total_investment / float(livestock.current_weight_kg or 1)
+
+        recommendation = self._generate_profitability_recommendation(
+            profit_margin, estimated_profit, livestock
+        )
+
+        return ProfitabilityResult(
+            livestock_id=livestock.id,
+            current_market_value=round(current_market_value, 2),
+            total_investment=round(total_investment, 2),
+            estimated_profit=round(estimated_profit, 2),
+            profit_margin_percentage=round(profit_margin, 2),
+            break_even_price=round(break_even_price, 2),
+            recommendation=recommendation,
+            cost_breakdown=cost_breakdown
+        )
+
     def _generate_profitability_recommendation(self, profit_margin: float, estimated_profit: float, livestock) -> str:
         """Generate profitability recommendation"""
         if profit_margin > 20:
@@ -338,32 +395,42 @@ class PricingAnalysisService:
         else:
             return f"Currently at loss ({profit_margin:.1f}%). Review feeding costs and consider veterinary consultation."
     
-    def _get_cost_breakdown(self, livestock) -> Dict:
-        """Get detailed cost breakdown for livestock"""
+    # Breakdown keys per cost category; everything else counts as other
+    _COST_CATEGORY_KEYS = {
+        'FEED': 'feed_costs',
+        'VETERINARY': 'veterinary_costs',
+        'MEDICINE': 'medicine_costs',
+    }
+
+    def _bulk_cost_breakdown(self, livestock_list) -> Dict[int, Dict]:
+        """
+        Cost breakdowns for many livestock at once, keyed by livestock id.
+        The database groups and sums per (livestock, category), so Python
+        only maps category totals onto breakdown keys.
+        """
         from .models import CostRecord
-        
-        costs = CostRecord.objects.filter(livestock=livestock)
-        
-        breakdown = {
-            'purchase_price': float(livestock.purchase_price or 0),
-            'feed_costs': 0,
-            'veterinary_costs': 0,
-            'medicine_costs': 0,
-            'other_costs': 0
+
+        breakdowns = {
+            livestock.id: {
+                'purchase_price': float(livestock.purchase_price or 0),
+                'feed_costs': 0,
+                'veterinary_costs': 0,
+                'medicine_costs': 0,
+                'other_costs': 0
+            }
+            for livestock in livestock_list
         }
-        
-        for cost in costs:
-            amount = float(cost.amount)
-            if cost.category == 'FEED':
-                breakdown['feed_costs'] += amount
-            elif cost.category == 'VETERINARY':
-                breakdown['veterinary_costs'] += amount
-            elif cost.category == 'MEDICINE':
-                breakdown['medicine_costs'] += amount
-            else:
-                breakdown['other_costs'] += amount
-        
-        return breakdown
+
+        totals = CostRecord.objects.filter(
+            livestock_id__in=breakdowns
+        ).values('livestock_id', 'category').annotate(total=Sum('amount'))
+
+        for row in totals:
+            breakdown = breakdowns[row['livestock_id']]
+            key = self._COST_CATEGORY_KEYS.get(row['category'], 'other_costs')
+            breakdown[key] += float(row['total'])
+
+        return breakdowns
     
     def _calculate_action_priority(self, profitability: ProfitabilityResult) -> int:
         """Calculate action priority for selling recommendations"""
@@ -381,15 +448,8 @@ class PricingAnalysisService:
     def _estimate_optimal_selling_time(self, livestock) -> str:
         """Estimate optimal selling time"""
         age_months = livestock.age_months or 0
-        
-        optimal_ages = {
-            'Cattle': 24,
-            'Goats': 12,
-            'Sheep': 12,
-            'Poultry': 3
-        }
-        
-        optimal_age = optimal_ages.get(livestock.animal_type.name, 12)
+
+        optimal_age = _OPTIMAL_AGES.get(livestock.animal_type.name, 12)
         
         if age_months >= optimal_age:
             return "Ready for sale now"
@@ -0,0 +1,16 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in JSONRenderer that serializes with orjson, which is several
+    times faster than the stdlib encoder on list payloads.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        # default=str covers Decimal and other types orjson doesn't
+        # serialize natively, matching DRF's encoder behaviour
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS, default=str)
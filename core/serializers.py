@@ -1,4 +1,7 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
 from rest_framework import serializers
+from rest_framework.fields import SkipField
 from .models import (
     AnimalType, Breed, Livestock, FeedType, FeedingRecommendation,
     Disease, Symptom, HealthRecord, MarketPrice, FarmerProfile,
@@ -6,6 +9,104 @@ from .models import (
 )
 
 
+class FastListSerializer(serializers.ListSerializer):
+    """
+    ListSerializer optimized for read-only list endpoints.
+
+    The default ListSerializer calls the child's to_representation per object,
+    which re-resolves the child's field list on every row. Here the readable
+    fields are resolved once and each row is built as a plain dict in a single
+    tight loop, cutting serialization CPU on lists of 100+ items.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        fields = list(self.child._readable_fields)
+
+        rows = []
+        for item in iterable:
+            row = {}
+            for field in fields:
+                try:
+                    attribute = field.get_attribute(item)
+                except SkipField:
+                    continue
+                if attribute is None:
+                    row[field.field_name] = None
+                else:
+                    row[field.field_name] = field.to_representation(attribute)
+            rows.append(row)
+        return rows
+
+
+class QuerysetOptimizationMixin:
+    """
+    Derives select_related/prefetch_related paths from the serializer's own
+    declared fields, so list views stay correctly eager-loaded as serializers
+    evolve instead of each view manually curating the paths.
+    """
+
+    @classmethod
+    def optimize_queryset(cls, queryset):
+        """Apply the eager loading this serializer's fields require"""
+        select, prefetch = cls._eager_load_paths(cls(), queryset.model)
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
+
+    @classmethod
+    def _eager_load_paths(cls, serializer, model, prefix=''):
+        select = []
+        prefetch = []
+        for field in serializer.fields.values():
+            source = field.source or field.field_name
+            if source == '*':
+                continue
+            if isinstance(field, serializers.ListSerializer):
+                # Nested many=True serializer -> reverse/M2M prefetch
+                prefetch.append(prefix + source.replace('.', '__'))
+            elif isinstance(field, serializers.BaseSerializer):
+                # Nested single serializer -> JOIN the FK and recurse
+                try:
+                    model_field = model._meta.get_field(source)
+                except FieldDoesNotExist:
+                    continue
+                if model_field.is_relation and (model_field.many_to_one or model_field.one_to_one):
+                    path = prefix + source
+                    select.append(path)
+                    nested_select, nested_prefetch = cls._eager_load_paths(
+                        field, model_field.related_model, prefix=path + '__'
+                    )
+                    select.extend(nested_select)
+                    prefetch.extend(nested_prefetch)
+            elif '.' in source:
+                # Dotted source (e.g. animal_type.name) -> JOIN the FK path
+                select.append(prefix + '__'.join(source.split('.')[:-1]))
+        return list(dict.fromkeys(select)), list(dict.fromkeys(prefetch))
+
+
+class FastSerializationMixin(QuerysetOptimizationMixin):
+    """
+    Mixin that routes many=True serialization through FastListSerializer
+    so list endpoints avoid the per-object serializer overhead.
+    """
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        allow_empty = kwargs.pop('allow_empty', None)
+        child_serializer = cls(*args, **kwargs)
+        list_kwargs = {'child': child_serializer}
+        if allow_empty is not None:
+            list_kwargs['allow_empty'] = allow_empty
+        list_kwargs.update({
+            key: value for key, value in kwargs.items()
+            if key in serializers.LIST_SERIALIZER_KWARGS
+        })
+        return FastListSerializer(*args, **list_kwargs)
+
+
 class AnimalTypeSerializer(serializers.ModelSerializer):
     class Meta:
         model = AnimalType
@@ -55,15 +156,15 @@ class FeedingRecommendationInputSerializer(serializers.Serializer):
         allow_blank=True
     )
     livestock_id = serializers.IntegerField(required=False, allow_null=True)
-    
+
     def validate_animal_type_id(self, value):
-        """Validate that animal type exists"""
+        """Validate that animal type exists (keeps the row for the view)"""
         try:
-            AnimalType.objects.get(id=value)
+            self.animal_type = AnimalType.objects.only('id', 'name').get(id=value)
         except AnimalType.DoesNotExist:
             raise serializers.ValidationError("Animal type not found")
         return value
-    
+
     def validate_livestock_id(self, value):
         """Validate that livestock exists if provided"""
         if value is not None:
@@ -74,6 +175,96 @@ class FeedingRecommendationInputSerializer(serializers.Serializer):
         return value
 
 
+# Valid purpose codes, resolved once at import time for the fast validator
+FEEDING_PURPOSE_CODES = frozenset(code for code, _ in Livestock.PURPOSE_CHOICES)
+
+
+def validate_feeding_input(data):
+    """
+    Plain-function validation for the hot feeding-recommendations endpoint.
+
+    Mirrors FeedingRecommendationInputSerializer (kept for the swagger
+    schema) without rebuilding the DRF field tree on every request.
+
+    Returns a (validated_data, animal_type, errors) tuple; errors is a
+    DRF-style {field: [messages]} dict and is empty on success.
+    """
+    errors = {}
+    validated = {}
+    animal_type = None
+
+    animal_type_id = data.get('animal_type_id')
+    if animal_type_id is None:
+        errors['animal_type_id'] = ['This field is required.']
+    else:
+        try:
+            animal_type_id = int(animal_type_id)
+        except (TypeError, ValueError):
+            errors['animal_type_id'] = ['A valid integer is required.']
+        else:
+            validated['animal_type_id'] = animal_type_id
+            try:
+                animal_type = AnimalType.objects.only('id', 'name').get(id=animal_type_id)
+            except AnimalType.DoesNotExist:
+                errors['animal_type_id'] = ['Animal type not found']
+
+    if 'age_months' in data:
+        age_months = data.get('age_months')
+        if age_months is None:
+            validated['age_months'] = None
+        else:
+            try:
+                age_months = int(age_months)
+            except (TypeError, ValueError):
+                errors['age_months'] = ['A valid integer is required.']
+            else:
+                if age_months < 0:
+                    errors['age_months'] = ['Ensure this value is greater than or equal to 0.']
+                else:
+                    validated['age_months'] = age_months
+
+    if 'weight_kg' in data:
+        weight_kg = data.get('weight_kg')
+        if weight_kg is None:
+            validated['weight_kg'] = None
+        else:
+            try:
+                weight_kg = float(weight_kg)
+            except (TypeError, ValueError):
+                errors['weight_kg'] = ['A valid number is required.']
+            else:
+                if weight_kg < 0:
+                    errors['weight_kg'] = ['Ensure this value is greater than or equal to 0.']
+                else:
+                    validated['weight_kg'] = weight_kg
+
+    if 'purpose' in data:
+        purpose = data.get('purpose')
+        if purpose == '' or purpose is None:
+            validated['purpose'] = ''
+        elif purpose in FEEDING_PURPOSE_CODES:
+            validated['purpose'] = purpose
+        else:
+            errors['purpose'] = [f'"{purpose}" is not a valid choice.']
+
+    if 'livestock_id' in data:
+        livestock_id = data.get('livestock_id')
+        if livestock_id is None:
+            validated['livestock_id'] = None
+        else:
+            try:
+                livestock_id = int(livestock_id)
+            except (TypeError, ValueError):
+                errors['livestock_id'] = ['A valid integer is required.']
+            else:
+                if Livestock.objects.filter(id=livestock_id).exists():
+                    validated['livestock_id'] = livestock_id
+                else:
+                    errors['livestock_id'] = ['Livestock not found']
+
+    return validated, animal_type, errors
+
+
 class FeedingResultSerializer(serializers.Serializer):
     """Serializer for feeding recommendation results"""
     feed_type = FeedTypeSerializer(read_only=True)
@@ -107,16 +298,30 @@ class FeedingRecommendationSerializer(serializers.ModelSerializer):
 
 # Additional serializers for other modules (disease, pricing)
 
-class SymptomSerializer(serializers.ModelSerializer):
+class SymptomSerializer(FastSerializationMixin, serializers.ModelSerializer):
     class Meta:
         model = Symptom
         fields = ['id', 'name', 'description']
 
 
-class DiseaseSerializer(serializers.ModelSerializer):
-    affected_animals = AnimalTypeSerializer(many=True, read_only=True)
-    symptoms = SymptomSerializer(many=True, read_only=True)
-    
+class DiseaseSerializer(FastSerializationMixin, serializers.ModelSerializer):
+    affected_animals = serializers.SerializerMethodField()
+    symptoms = serializers.SerializerMethodField()
+
+    def get_affected_animals(self, obj):
+        # Read the materialized to_attr list when the view prefetched it,
+        # so we don't re-trigger a query per disease via .all()
+        animals = getattr(obj, 'prefetched_affected_animals', None)
+        if animals is None:
+            animals = obj.affected_animals.all()
+        return AnimalTypeSerializer(animals, many=True).data
+
+    def get_symptoms(self, obj):
+        symptoms = getattr(obj, 'prefetched_symptoms', None)
+        if symptoms is None:
+            symptoms = obj.symptoms.all()
+        return SymptomSerializer(symptoms, many=True).data
+
     class Meta:
         model = Disease
         fields = ['id', 'name', 'description', 'affected_animals', 'severity',
@@ -136,7 +341,7 @@ class HealthRecordSerializer(serializers.ModelSerializer):
                  'recovery_status', 'notes']
 
 
-class MarketPriceSerializer(serializers.ModelSerializer):
+class MarketPriceSerializer(FastSerializationMixin, serializers.ModelSerializer):
     animal_type = AnimalTypeSerializer(read_only=True)
     breed = BreedSerializer(read_only=True)
     
@@ -158,25 +363,25 @@ class FarmerProfileSerializer(serializers.ModelSerializer):
 
 
 # Quick lookup serializers (minimal data for dropdowns/selects)
-class AnimalTypeSimpleSerializer(serializers.ModelSerializer):
+class AnimalTypeSimpleSerializer(FastSerializationMixin, serializers.ModelSerializer):
     class Meta:
         model = AnimalType
         fields = ['id', 'name']
 
 
-class BreedSimpleSerializer(serializers.ModelSerializer):
+class BreedSimpleSerializer(FastSerializationMixin, serializers.ModelSerializer):
     class Meta:
         model = Breed
         fields = ['id', 'name', 'animal_type']
 
 
-class FeedTypeSimpleSerializer(serializers.ModelSerializer):
+class FeedTypeSimpleSerializer(FastSerializationMixin, serializers.ModelSerializer):
     class Meta:
         model = FeedType
         fields = ['id', 'name', 'category', 'cost_per_kg']
 
 
-class LivestockSimpleSerializer(serializers.ModelSerializer):
+class LivestockSimpleSerializer(FastSerializationMixin, serializers.ModelSerializer):
     animal_type_name = serializers.CharField(source='animal_type.name', read_only=True)
     
     class Meta:
@@ -1,11 +1,12 @@
 
 from django.db import models
-from typing import List, Dict, Optional, TYPE_CHECKING
+from typing import List, Dict, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .models import Disease, Symptom
 
 from dataclasses import dataclass
+from .cache_utils import get_cached_animal_type
 from .models import (
     AnimalType, FeedType, FeedingRecommendation, Livestock
 )
@@ -52,7 +53,7 @@ class FeedingRecommendationService:
             List of FeedingResult objects with recommendations
         """
         try:
-            animal_type = AnimalType.objects.get(id=animal_input.animal_type_id)
+            animal_type = get_cached_animal_type(animal_input.animal_type_id)
         except AnimalType.DoesNotExist:
             return []
         
@@ -70,7 +71,9 @@ class FeedingRecommendationService:
         base_recommendations = self._get_base_recommendations(animal_type, animal_input)
         
         # Apply intelligent adjustments
-        adjusted_recommendations = self._apply_intelligent_adjustments(base_recommendations, animal_input)
+        adjusted_recommendations = self._apply_intelligent_adjustments(
+            base_recommendations, animal_input, animal_type
+        )
         
         # Convert to FeedingResult objects
         results = []
@@ -96,7 +99,7 @@ class FeedingRecommendationService:
         """Get base recommendations from database"""
         recommendations = FeedingRecommendation.objects.filter(
             animal_type=animal_type
-        )
+        ).select_related('feed_type')
         
         # Filter by age if provided
         if animal_input.age_months is not None:
@@ -136,27 +139,36 @@ class FeedingRecommendationService:
         
         return base_recs
     
-    def _apply_intelligent_adjustments(self, base_recommendations: List[Dict], animal_input: AnimalInput) -> List[Dict]:
+    def _apply_intelligent_adjustments(self, base_recommendations: List[Dict], animal_input: AnimalInput,
+                                       animal_type: AnimalType) -> List[Dict]:
         """Apply intelligent adjustments based on animal specifics"""
         adjusted_recs = []
-        
+
+        # The adjustment factors depend only on the animal, not on the
+        # recommendation row, so resolve each one once up front instead of
+        # re-deriving it (and re-fetching the AnimalType) per row
+        weight_factor = (self._calculate_weight_factor(animal_input.weight_kg, animal_type)
+                        if animal_input.weight_kg else 1.0)
+        age_factor = (self._calculate_age_factor(animal_input.age_months, animal_type)
+                     if animal_input.age_months else 1.0)
+        purpose_factor = (self._calculate_purpose_factor(animal_input.purpose)
+                         if animal_input.purpose else 1.0)
+
         for rec in base_recommendations:
             adjusted_rec = rec.copy()
-            
+
             # Weight-based adjustments
             if animal_input.weight_kg:
-                weight_factor = self._calculate_weight_factor(animal_input.weight_kg, animal_input.animal_type_id)
                 adjusted_rec['daily_amount_kg'] *= weight_factor
-                
+
                 if weight_factor != 1.0:
                     adjusted_rec['notes'] += f" Amount adjusted by {weight_factor:.2f}x for weight."
                     adjusted_rec['source'] = 'Smart Recommendation (Weight Adjusted)'
-            
+
             # Age-based adjustments
             if animal_input.age_months:
-                age_factor = self._calculate_age_factor(animal_input.age_months, animal_input.animal_type_id)
                 adjusted_rec['daily_amount_kg'] *= age_factor
-                
+
                 if age_factor != 1.0:
                     adjusted_rec['notes'] += f" Amount adjusted by {age_factor:.2f}x for age."
                     if 'Smart Recommendation' not in adjusted_rec['source']:
@@ -164,9 +176,8 @@ class FeedingRecommendationService:
             
             # Purpose-based adjustments
             if animal_input.purpose:
-                purpose_factor = self._calculate_purpose_factor(animal_input.purpose)
                 adjusted_rec['daily_amount_kg'] *= purpose_factor
-                
+
                 if purpose_factor != 1.0:
                     adjusted_rec['notes'] += f" Amount adjusted by {purpose_factor:.2f}x for {animal_input.purpose.lower()} purpose."
                     if 'Smart Recommendation' not in adjusted_rec['source']:
@@ -183,13 +194,11 @@ class FeedingRecommendationService:
         
         return adjusted_recs
     
-    def _calculate_weight_factor(self, weight_kg: float, animal_type_id: int) -> float:
+    def _calculate_weight_factor(self, weight_kg: float, animal_type: AnimalType) -> float:
         """Calculate adjustment factor based on weight"""
         # Basic weight-based scaling
         # These are simplified rules - in reality, would be more complex
-        
-        animal_type = AnimalType.objects.get(id=animal_type_id)
-        
+
         if animal_type.name == 'Cattle':
             if weight_kg < 100:
                 return 0.6  # Young cattle need less
@@ -210,10 +219,8 @@ class FeedingRecommendationService:
         
         return 1.0  # No adjustment needed
     
-    def _calculate_age_factor(self, age_months: int, animal_type_id: int) -> float:
+    def _calculate_age_factor(self, age_months: int, animal_type: AnimalType) -> float:
         """Calculate adjustment factor based on age"""
-        animal_type = AnimalType.objects.get(id=animal_type_id)
-        
         if animal_type.name == 'Cattle':
             if age_months < 6:
                 return 0.5  # Calves need less solid feed
@@ -249,7 +256,7 @@ class FeedingRecommendationService:
     def _get_emergency_recommendations(self, animal_input: AnimalInput) -> List[Dict]:
         """Provide basic recommendations when no database matches found"""
         try:
-            animal_type = AnimalType.objects.get(id=animal_input.animal_type_id)
+            animal_type = get_cached_animal_type(animal_input.animal_type_id)
         except AnimalType.DoesNotExist:
             return []
         
@@ -284,18 +291,17 @@ class FeedingRecommendationService:
             return float(feed_type.cost_per_kg) * daily_amount_kg
         return 0.0
     
-    def get_feeding_summary_for_livestock(self, livestock_id: int) -> Dict:
-        """Get feeding summary for a specific livestock animal"""
-        try:
-            livestock = Livestock.objects.get(id=livestock_id)
-        except Livestock.DoesNotExist:
-            return {'error': 'Livestock not found'}
-        
+    def get_feeding_summary_for_livestock(self, livestock: Livestock) -> Dict:
+        """Get feeding summary for an already-fetched livestock animal"""
+        # Build the input from the instance the caller authorized and
+        # fetched - no second SELECT here or in get_recommendations
         animal_input = AnimalInput(
-            animal_type_id=livestock.animal_type.id,
-            livestock_id=livestock_id
+            animal_type_id=livestock.animal_type_id,
+            age_months=livestock.age_months,
+            weight_kg=float(livestock.current_weight_kg or 0),
+            purpose=livestock.purpose
         )
-        
+
         recommendations = self.get_recommendations(animal_input)
         
         total_daily_cost = sum(rec.cost_per_day for rec in recommendations)
@@ -355,26 +361,35 @@ class DiseaseMonitoringService:
             List of DiseaseResult objects sorted by confidence score
         """
         from .models import AnimalType, Disease, Symptom
-        
+
         try:
-            animal_type = AnimalType.objects.get(id=symptom_input.animal_type_id)
+            animal_type = get_cached_animal_type(symptom_input.animal_type_id)
         except AnimalType.DoesNotExist:
             return []
-        
-        # Get input symptoms
-        input_symptoms = Symptom.objects.filter(id__in=symptom_input.symptoms)
-        if not input_symptoms.exists():
+
+        # Get input symptoms; in_bulk gives one query plus an id map, and
+        # rebuilding the list from the map preserves the caller's ordering.
+        # dict.fromkeys drops repeated ids so duplicates in the submission
+        # cannot inflate the confidence scoring
+        symptom_map = Symptom.objects.in_bulk(symptom_input.symptoms)
+        if not symptom_map:
             return []
-        
+        input_symptoms = [
+            symptom_map[symptom_id]
+            for symptom_id in dict.fromkeys(symptom_input.symptoms)
+            if symptom_id in symptom_map
+        ]
+        input_symptom_ids = set(symptom_map)
+
         # Get diseases that affect this animal type
         potential_diseases = Disease.objects.filter(
             affected_animals=animal_type
         ).prefetch_related('symptoms')
-        
+
         # Analyze each disease for symptom matches
         disease_results = []
         for disease in potential_diseases:
-            result = self._analyze_disease_match(disease, input_symptoms)
+            result = self._analyze_disease_match(disease, input_symptoms, input_symptom_ids)
             if result.confidence_score > 0:  # Only include diseases with some symptom match
                 disease_results.append(result)
         
@@ -383,21 +398,23 @@ class DiseaseMonitoringService:
         
         return disease_results[:10]  # Return top 10 matches
     
-    def _analyze_disease_match(self, disease, input_symptoms) -> DiseaseResult:
+    def _analyze_disease_match(self, disease, input_symptoms, input_symptom_ids) -> DiseaseResult:
         """Analyze how well input symptoms match a specific disease"""
-        disease_symptoms = disease.symptoms.all()
-        
-        # Find matching symptoms
-        matching_symptoms = list(set(input_symptoms) & set(disease_symptoms))
-        
-        # Find missing symptoms
-        missing_symptoms = list(set(disease_symptoms) - set(matching_symptoms))
-        
+        # One pass over the prefetched symptom list against the input id set -
+        # no per-disease set construction or extra queries
+        matching_symptoms = []
+        missing_symptoms = []
+        for symptom in disease.symptoms.all():
+            if symptom.id in input_symptom_ids:
+                matching_symptoms.append(symptom)
+            else:
+                missing_symptoms.append(symptom)
+
         # Calculate confidence score
         confidence_score = self._calculate_confidence_score(
-            disease, 
-            matching_symptoms, 
-            missing_symptoms, 
+            disease,
+            matching_symptoms,
+            missing_symptoms,
             input_symptoms
         )
         
@@ -416,8 +433,8 @@ class DiseaseMonitoringService:
         """Calculate confidence score for disease match"""
         if not matching_symptoms:
             return 0.0
-        
-        total_disease_symptoms = len(disease.symptoms.all())
+
+        total_disease_symptoms = len(matching_symptoms) + len(missing_symptoms)
         total_input_symptoms = len(input_symptoms)
         matching_count = len(matching_symptoms)
         
@@ -451,16 +468,25 @@ class DiseaseMonitoringService:
         # Ensure score is between 0 and 1
         return max(0.0, min(1.0, final_score))
     
-    def get_critical_alerts(self, symptom_input: SymptomInput) -> List[DiseaseResult]:
-        """Get critical disease alerts that require immediate attention"""
+    def analyze_full(self, symptom_input: SymptomInput) -> Tuple[List[DiseaseResult], List[DiseaseResult]]:
+        """
+        Run the symptom analysis once and return (all results, critical alerts).
+        The alerts are a filtered view of the same scored results, so callers
+        that need both avoid a second query-and-scoring pass.
+        """
         all_results = self.analyze_symptoms(symptom_input)
-        
+
         # Filter for critical and high severity diseases with reasonable confidence
         critical_alerts = [
             result for result in all_results
             if result.severity_level in ['CRITICAL', 'HIGH'] and result.confidence_score > 0.3
         ]
-        
+
+        return all_results, critical_alerts
+
+    def get_critical_alerts(self, symptom_input: SymptomInput) -> List[DiseaseResult]:
+        """Get critical disease alerts that require immediate attention"""
+        _, critical_alerts = self.analyze_full(symptom_input)
         return critical_alerts
     
     def get_prevention_recommendations(self, animal_type_id: int) -> Dict:
@@ -468,7 +494,7 @@ class DiseaseMonitoringService:
         from .models import AnimalType, Disease
         
         try:
-            animal_type = AnimalType.objects.get(id=animal_type_id)
+            animal_type = get_cached_animal_type(animal_type_id)
         except AnimalType.DoesNotExist:
             return {'error': 'Animal type not found'}
         
@@ -511,15 +537,10 @@ class DiseaseMonitoringService:
             ]
         }
     
-    def create_health_record(self, livestock_id: int, symptom_ids: List[int], suspected_disease_id: Optional[int] = None) -> Dict:
-        """Create a health record for livestock based on symptoms"""
-        from .models import Livestock, Symptom, Disease, HealthRecord
-        
-        try:
-            livestock = Livestock.objects.get(id=livestock_id)
-        except Livestock.DoesNotExist:
-            return {'error': 'Livestock not found'}
-        
+    def create_health_record(self, livestock: 'Livestock', symptom_ids: List[int], suspected_disease_id: Optional[int] = None) -> Dict:
+        """Create a health record for an already-fetched livestock animal"""
+        from .models import Symptom, Disease, HealthRecord
+
         symptoms = Symptom.objects.filter(id__in=symptom_ids)
         suspected_disease = None
         
@@ -554,7 +575,7 @@ class DiseaseMonitoringService:
         from .models import AnimalType, Symptom
         
         try:
-            animal_type = AnimalType.objects.get(id=animal_type_id)
+            animal_type = get_cached_animal_type(animal_type_id)
         except AnimalType.DoesNotExist:
             return []
         
@@ -0,0 +1,90 @@
+from django.db.models import F, Sum
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .cache_utils import (
+    bump_feeding_cache_version, bump_market_price_cache_version,
+    bump_reference_cache_version
+)
+from .models import (
+    AnimalType, Breed, CostRecord, Disease, FeedingRecommendation, FeedType,
+    Livestock, MarketPrice, Symptom
+)
+
+
+@receiver(post_save, sender=FeedingRecommendation)
+@receiver(post_delete, sender=FeedingRecommendation)
+def invalidate_feeding_recommendation_cache(sender, **kwargs):
+    """Drop cached feeding recommendations when the source data changes"""
+    bump_feeding_cache_version()
+
+
+@receiver(post_save, sender=MarketPrice)
+@receiver(post_delete, sender=MarketPrice)
+def invalidate_market_price_cache(sender, **kwargs):
+    """Drop cached market price payloads when pricing data changes"""
+    bump_market_price_cache_version()
+
+
+@receiver(post_save, sender=AnimalType)
+@receiver(post_delete, sender=AnimalType)
+@receiver(post_save, sender=Breed)
+@receiver(post_delete, sender=Breed)
+@receiver(post_save, sender=Disease)
+@receiver(post_delete, sender=Disease)
+@receiver(post_save, sender=FeedType)
+@receiver(post_delete, sender=FeedType)
+@receiver(post_save, sender=Symptom)
+@receiver(post_delete, sender=Symptom)
+def invalidate_reference_cache(sender, **kwargs):
+    """Drop cached lookup lists when reference data changes"""
+    bump_reference_cache_version()
+
+
+def _recompute_total_costs(livestock_id):
+    """Rebuild one animal's denormalized cost total from its cost rows"""
+    total = CostRecord.objects.filter(
+        livestock_id=livestock_id
+    ).aggregate(total=Sum('amount'))['total'] or 0
+    Livestock.objects.filter(pk=livestock_id).update(total_costs=total)
+
+
+@receiver(pre_save, sender=CostRecord)
+def stash_previous_cost_livestock(sender, instance, **kwargs):
+    """Remember which animal an edited cost row pointed at before the save"""
+    if instance.pk:
+        instance._previous_livestock_id = CostRecord.objects.filter(
+            pk=instance.pk
+        ).values_list('livestock_id', flat=True).first()
+
+
+@receiver(post_save, sender=CostRecord)
+def update_total_costs_on_save(sender, instance, created, **kwargs):
+    """Keep Livestock.total_costs in step with its cost records"""
+    if created:
+        # New rows only ever add their amount; a single UPDATE with an F
+        # expression avoids re-reading the animal
+        if instance.livestock_id is not None:
+            Livestock.objects.filter(pk=instance.livestock_id).update(
+                total_costs=F('total_costs') + instance.amount
+            )
+        return
+
+    # An edit may have changed the amount or moved the cost to another
+    # animal, so rebuild the totals of both the current and, if the row
+    # moved, the previous animal
+    previous_livestock_id = getattr(instance, '_previous_livestock_id', None)
+    if instance.livestock_id is not None:
+        _recompute_total_costs(instance.livestock_id)
+    if previous_livestock_id is not None and previous_livestock_id != instance.livestock_id:
+        _recompute_total_costs(previous_livestock_id)
+
+
+@receiver(post_delete, sender=CostRecord)
+def update_total_costs_on_delete(sender, instance, **kwargs):
+    """Subtract a removed cost record from its animal's running total"""
+    if instance.livestock_id is None:
+        return
+    Livestock.objects.filter(pk=instance.livestock_id).update(
+        total_costs=F('total_costs') - instance.amount
+    )
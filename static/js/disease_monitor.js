@@ -62,9 +62,16 @@ async function loadAnimalTypes() {
 
 async function loadUserLivestock() {
     try {
-        const response = await fetch('/api/user/livestock/');
-        const livestock = await response.json();
-        
+        // The endpoint is cursor-paginated; walk the pages and collect results
+        const livestock = [];
+        let url = '/api/user/livestock/';
+        while (url) {
+            const response = await fetch(url);
+            const data = await response.json();
+            livestock.push(...data.results);
+            url = data.next;
+        }
+
         const select = document.getElementById('livestockSelect');
         select.innerHTML = '<option value="">Choose from your livestock...</option>';
         
@@ -462,18 +462,25 @@ class PricingGuide {
     
     async loadQuickStats() {
         try {
-            const response = await fetch(this.apiUrls.userLivestock);
-            const data = await response.json();
-            
+            // The endpoint is cursor-paginated; walk the pages and collect results
+            const data = [];
+            let url = this.apiUrls.userLivestock;
+            while (url) {
+                const response = await fetch(url);
+                const page = await response.json();
+                data.push(...page.results);
+                url = page.next;
+            }
+
             const totalLivestock = data.length;
-            const readyForSale = data.filter(livestock => 
-                livestock.current_weight_kg > 0 && 
+            const readyForSale = data.filter(livestock =>
+                livestock.current_weight_kg > 0 &&
                 ['HEALTHY', 'PREGNANT'].includes(livestock.status)
             ).length;
-            
+
             document.getElementById('totalLivestock').textContent = totalLivestock;
             document.getElementById('readyForSale').textContent = readyForSale;
-            
+
             // Estimate total value (simplified calculation)
             const estimatedValue = data.reduce((total, livestock) => {
                 const weight = livestock.current_weight_kg || 0;